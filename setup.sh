@@ -18,6 +18,9 @@ echo -e "${CYAN}  🐛 REDFISH_DEBUG=true          - Full debug mode with detail
 echo -e "${CYAN}  📊 REDFISH_PERF_DEBUG=true     - Performance monitoring and metrics${NC}"
 echo -e "${CYAN}  ⚡ REDFISH_VMWARE_DEBUG=true   - VMware operations tracking${NC}"
 echo -e "${CYAN}  📁 REDFISH_LOG_DIR=/path       - Custom log directory${NC}"
+echo -e "${CYAN}  📝 REDFISH_LOG_FILE=/path      - Fixed log file (skips log directory search)${NC}"
+echo -e "${CYAN}  📋 REDFISH_CONFIG=/path        - Configuration file (default for --config)${NC}"
+echo -e "${CYAN}  🖥️  REDFISH_LOG_CONSOLE=false   - Log to the file only, not stdout/journal${NC}"
 echo ""
 echo -e "${YELLOW}💡 Production Mode: Standard logging (default)${NC}"
 echo -e "${YELLOW}💡 Debug Mode: Use 'sudo systemctl edit redfish-vmware-server' to add environment variables${NC}"
@@ -721,6 +724,9 @@ case "${1:-}" in
         echo "  REDFISH_PERF_DEBUG=true     Enable performance monitoring"
         echo "  REDFISH_VMWARE_DEBUG=true   Enable VMware operations tracking"
         echo "  REDFISH_LOG_DIR=/path       Set custom log directory"
+        echo "  REDFISH_LOG_FILE=/path      Log to a fixed file (skips log directory search)"
+        echo "  REDFISH_CONFIG=/path        Configuration file (default for --config)"
+        echo "  REDFISH_LOG_CONSOLE=false   Log to the file only, not stdout/journal"
         echo ""
         exit 0
         ;;
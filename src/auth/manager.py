@@ -6,11 +6,17 @@ Handles Redfish authentication and session management.
 
 import base64
 import logging
+import threading
 import time
+import uuid
 from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Basic-auth decisions are reused for this many seconds per Authorization header
+AUTH_CACHE_TTL = 60
+AUTH_CACHE_MAX_ENTRIES = 1024
+
 
 class AuthenticationManager:
     """Manages authentication and sessions for Redfish server"""
@@ -18,7 +24,11 @@ class AuthenticationManager:
     def __init__(self, config: Dict = None):
         self.config = config or {}
         self.sessions = {}
+        self._session_ids_by_token = {}  # token -> session id, so validation is a dict lookup
+        self.session_lock = threading.Lock()
         self.session_timeout = 600  # 10 minutes
+        self._basic_auth_cache = {}  # header -> (expires_at, username), successful logins only
+        self._basic_auth_lock = threading.Lock()
         logger.info("🔐 Authentication manager initialized")
     
     def authenticate_request(self, request_handler) -> Tuple[bool, Optional[str]]:
@@ -39,20 +49,16 @@ class AuthenticationManager:
         
         try:
             if auth_header.startswith('Basic '):
-                # Basic Authentication
-                encoded_credentials = auth_header[6:]
-                decoded_credentials = base64.b64decode(encoded_credentials).decode('utf-8')
-                username, password = decoded_credentials.split(':', 1)
-                
-                logger.debug(f"🔑 Basic auth attempt for user: {username}")
+                # Basic Authentication; pollers resend the same header, so reuse the decision
+                now = time.monotonic()
+                cached = self._basic_auth_cache.get(auth_header)
+                if cached is not None and cached[0] > now:
+                    return True, cached[1]
                 
-                # Check credentials (using default admin/password for now)
-                if username == 'admin' and password == 'password':
-                    logger.info(f"✅ Basic authentication successful for: {username}")
-                    return True, username
-                else:
-                    logger.warning(f"❌ Basic authentication failed for: {username}")
-                    return False, None
+                result = self._check_basic_credentials(auth_header[6:])
+                if result[0]:
+                    self._remember_basic_auth(auth_header, result[1], now)
+                return result
                     
             elif auth_header.startswith('Bearer '):
                 # Session Token Authentication
@@ -60,16 +66,36 @@ class AuthenticationManager:
                 return self._validate_session_token(token)
                 
         except Exception as e:
-            logger.error(f"❌ Authentication error: {e}")
+            logger.error("❌ Authentication error: %s", e)
             return False, None
         
         logger.debug("🔒 Unsupported authentication method")
         return False, None
     
+    def _check_basic_credentials(self, encoded_credentials: str) -> Tuple[bool, Optional[str]]:
+        """Decode and verify Basic credentials"""
+        decoded_credentials = base64.b64decode(encoded_credentials).decode('utf-8')
+        username, password = decoded_credentials.split(':', 1)
+        
+        logger.debug("🔑 Basic auth attempt for user: %s", username)
+        
+        # Check credentials (using default admin/password for now)
+        if username == 'admin' and password == 'password':
+            logger.info("✅ Basic authentication successful for: %s", username)
+            return True, username
+        else:
+            logger.warning("❌ Basic authentication failed for: %s", username)
+            return False, None
+    
+    def _remember_basic_auth(self, auth_header: str, username: Optional[str], now: float):
+        """Cache a successful Basic-auth login, evicting the oldest entry when full"""
+        with self._basic_auth_lock:
+            if auth_header not in self._basic_auth_cache and len(self._basic_auth_cache) >= AUTH_CACHE_MAX_ENTRIES:
+                self._basic_auth_cache.pop(next(iter(self._basic_auth_cache)))
+            self._basic_auth_cache[auth_header] = (now + AUTH_CACHE_TTL, username)
+    
     def create_session(self, username: str) -> Dict:
         """Create a new session for authenticated user"""
-        import uuid
-        
         session_id = str(uuid.uuid4())
         session_token = str(uuid.uuid4())
         
@@ -83,8 +109,10 @@ class AuthenticationManager:
             'LastAccessTime': time.time()
         }
         
-        self.sessions[session_id] = session_data
-        logger.info(f"🎫 Session created for user: {username} (ID: {session_id})")
+        with self.session_lock:
+            self.sessions[session_id] = session_data
+            self._session_ids_by_token[session_token] = session_id
+        logger.info("🎫 Session created for user: %s (ID: %s)", username, session_id)
         
         return {
             'Id': session_id,
@@ -96,17 +124,20 @@ class AuthenticationManager:
         """Validate session token"""
         current_time = time.time()
         
-        for session_id, session_data in self.sessions.items():
-            if session_data.get('Token') == token:
+        with self.session_lock:
+            session_id = self._session_ids_by_token.get(token)
+            session_data = self.sessions.get(session_id) if session_id is not None else None
+            if session_data is not None:
                 # Check if session expired
                 if current_time - session_data['LastAccessTime'] > self.session_timeout:
-                    logger.warning(f"🕐 Session expired for: {session_data['UserName']}")
+                    logger.warning("🕐 Session expired for: %s", session_data['UserName'])
                     del self.sessions[session_id]
+                    del self._session_ids_by_token[token]
                     return False, None
                 
                 # Update last access time
                 session_data['LastAccessTime'] = current_time
-                logger.debug(f"✅ Valid session token for: {session_data['UserName']}")
+                logger.debug("✅ Valid session token for: %s", session_data['UserName'])
                 return True, session_data['UserName']
         
         logger.warning("❌ Invalid session token")
@@ -114,10 +145,13 @@ class AuthenticationManager:
     
     def delete_session(self, session_id: str) -> bool:
         """Delete a session"""
-        if session_id in self.sessions:
-            username = self.sessions[session_id]['UserName']
-            del self.sessions[session_id]
-            logger.info(f"🗑️ Session deleted for user: {username} (ID: {session_id})")
+        with self.session_lock:
+            session_data = self.sessions.pop(session_id, None)
+            if session_data:
+                self._session_ids_by_token.pop(session_data['Token'], None)
+        if session_data:
+            username = session_data['UserName']
+            logger.info("🗑️ Session deleted for user: %s (ID: %s)", username, session_id)
             return True
         return False
     
@@ -127,17 +161,20 @@ class AuthenticationManager:
     
     def list_sessions(self) -> Dict:
         """List all active sessions"""
+        with self.session_lock:
+            session_ids = list(self.sessions)
+        
         return {
             '@odata.type': '#SessionCollection.SessionCollection',
             '@odata.id': '/redfish/v1/SessionService/Sessions',
             'Name': 'Session Collection',
             'Description': 'Active Sessions',
-            'Members@odata.count': len(self.sessions),
+            'Members@odata.count': len(session_ids),
             'Members': [
                 {
                     '@odata.id': f'/redfish/v1/SessionService/Sessions/{session_id}'
                 }
-                for session_id in self.sessions.keys()
+                for session_id in session_ids
             ]
         }
     
@@ -146,11 +183,12 @@ class AuthenticationManager:
         current_time = time.time()
         expired_sessions = []
         
-        for session_id, session_data in self.sessions.items():
-            if current_time - session_data['LastAccessTime'] > self.session_timeout:
-                expired_sessions.append(session_id)
+        with self.session_lock:
+            for session_id, session_data in list(self.sessions.items()):
+                if current_time - session_data['LastAccessTime'] > self.session_timeout:
+                    expired_sessions.append((session_id, session_data['UserName']))
+                    del self.sessions[session_id]
+                    self._session_ids_by_token.pop(session_data['Token'], None)
         
-        for session_id in expired_sessions:
-            username = self.sessions[session_id]['UserName']
-            del self.sessions[session_id]
-            logger.info(f"🧹 Expired session cleaned up for: {username} (ID: {session_id})")
+        for session_id, username in expired_sessions:
+            logger.info("🧹 Expired session cleaned up for: %s (ID: %s)", username, session_id)
@@ -4,29 +4,30 @@ Chassis Handler
 Handles Redfish Chassis endpoints for physical/virtual chassis management.
 """
 
-import json
 import logging
 from typing import Dict, Optional
 
 from models.redfish_schemas import RedfishModels
+from .json_response import JsonResponseMixin, prebuilt_response
 
 logger = logging.getLogger(__name__)
 
 
-class ChassisHandler:
+class ChassisHandler(JsonResponseMixin):
     """Handler for Redfish Chassis endpoints"""
     
     def __init__(self, vm_configs: Dict, vmware_clients: Dict):
         self.vm_configs = vm_configs
         self.vmware_clients = vmware_clients
+        # The VM list is fixed at startup, so the collection is serialized once
+        self._collection_response = prebuilt_response(RedfishModels.get_chassis_collection(vm_configs))
         logger.info("🏗️ Chassis handler initialized")
     
     def handle_get(self, request_handler, path: str):
         """Handle GET requests for Chassis"""
         if path == '/redfish/v1/Chassis':
             # Chassis collection
-            data = RedfishModels.get_chassis_collection(list(self.vm_configs.keys()))
-            self._send_json_response(request_handler, 200, data)
+            self._send_json_bytes(request_handler, 200, *self._collection_response)
         elif '/redfish/v1/Chassis/' in path:
             # Individual chassis
             chassis_id = self._extract_chassis_id(path)
@@ -367,22 +368,3 @@ class ChassisHandler:
             self._send_json_response(request_handler, 200, data)
         else:
             self._send_error_response(request_handler, 404, "Not Found")
-    
-    def _send_json_response(self, request_handler, status_code: int, data: Dict):
-        """Send JSON response"""
-        json_data = json.dumps(data, indent=2)
-        request_handler.send_response(status_code)
-        request_handler.send_header('Content-Type', 'application/json')
-        request_handler.send_header('Content-Length', str(len(json_data)))
-        request_handler.end_headers()
-        request_handler.wfile.write(json_data.encode('utf-8'))
-    
-    def _send_error_response(self, request_handler, status_code: int, message: str):
-        """Send error response"""
-        error_data = {
-            "error": {
-                "code": f"Base.1.0.{status_code}",
-                "message": message
-            }
-        }
-        self._send_json_response(request_handler, status_code, error_data)
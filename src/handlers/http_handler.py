@@ -5,16 +5,90 @@ Handles HTTP requests with comprehensive logging, debugging, and performance mon
 Routes requests to appropriate Redfish handlers with detailed tracking.
 """
 
-import json
+import gzip
+import hashlib
+import io
 import logging
+import ssl
 import time
 import threading
 import uuid
+from email.utils import formatdate
+from functools import lru_cache
+from typing import Optional
 from http.server import BaseHTTPRequestHandler
 from utils.logging_config import create_debug_context, log_performance_metric
+from utils.serialization import dumps, loads
 
 logger = logging.getLogger(__name__)
 
+# Largest request body accepted; Redfish actions and PATCHes are a few hundred bytes
+MAX_BODY = 1 << 20
+
+# Header lines shared by every JSON response, encoded once
+_JSON_HEADER_LINES = b'Content-Type: application/json\r\nCache-Control: no-cache\r\n'
+
+# JSON bodies at least this large are gzip-compressed for clients that accept it
+GZIP_MIN_SIZE = 1024
+
+
+def content_length_line(body: bytes) -> bytes:
+    """Encoded Content-Length header line for a response body"""
+    return b'Content-Length: %d\r\n' % len(body)
+
+
+def etag_for(body: bytes) -> str:
+    """Strong ETag for a response body that never changes while the server runs"""
+    return '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+def gzip_body(body: bytes) -> bytes:
+    """Gzip a response body; a fixed mtime keeps the output identical for identical input"""
+    return gzip.compress(body, compresslevel=1, mtime=0)
+
+
+@lru_cache(maxsize=64)
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding value allows gzip, honouring q-values (q=0 refuses)"""
+    wildcard_q = None
+    for item in accept_encoding.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding in ('gzip', 'x-gzip'):
+            return q > 0
+        if coding == '*':
+            wildcard_q = q
+    return wildcard_q is not None and wildcard_q > 0
+
+
+# log_message() text emitted by BaseHTTPRequestHandler for TLS/garbage on the HTTP port
+_BAD_PATTERNS = ('Bad request version', 'Bad request syntax', 'Bad HTTP/0.9 request')
+
+# Substrings of a setup() failure that point at a TLS client on the plain HTTP port
+_SSL_ERROR_TERMS = ('ssl', 'tls', 'handshake', 'wrong version')
+
+# Last formatted HTTP Date header value, refreshed at most once per second
+_HTTP_DATE_CACHE = (0, '')
+
+
+def _http_date() -> str:
+    """Return the current time as an RFC 7231 date, cached to one-second granularity"""
+    global _HTTP_DATE_CACHE
+    t = int(time.time())
+    cached_t, cached = _HTTP_DATE_CACHE
+    if t != cached_t:
+        cached = formatdate(t, usegmt=True)
+        _HTTP_DATE_CACHE = (t, cached)
+    return cached
+
 
 class RequestTracker:
     """Track request metrics and statistics"""
@@ -59,22 +133,109 @@ request_tracker = RequestTracker()
 class RedfishRequestHandler(BaseHTTPRequestHandler):
     """Enhanced Redfish HTTP request handler with comprehensive logging"""
     
+    # Persistent connections: Ironic re-polls the same BMC endpoints constantly,
+    # so reuse the TCP (and TLS) session. Every response carries Content-Length.
+    protocol_version = 'HTTP/1.1'
+    # Drop idle keep-alive connections instead of holding their thread forever
+    timeout = 120
+    
+    # Buffer writes so the status line, headers and body of a response go out
+    # in a single send; handle_one_request() flushes after every request.
+    wbufsize = 64 * 1024
+    # Responses are written in one send, so Nagle would only add latency
+    disable_nagle_algorithm = True
+    
     def setup(self):
         """Setup connection with enhanced SSL/TLS detection"""
-        self.request_id = str(uuid.uuid4())[:8]  # Short unique ID for this request
+        # Short unique ID for the connection; parse_request() gives each
+        # keep-alive request on it its own request_id
+        self.connection_id = self.request_id = str(uuid.uuid4())[:8]
+        # The peer is fixed for the connection; every keep-alive request logs it
+        self.client_ip = client_ip = self.client_address[0]
         try:
             super().setup()
-            logger.debug(f"🔗 [{self.request_id}] Connection established from {self.client_address[0]}")
         except Exception as e:
             error_str = str(e).lower()
-            client_ip = getattr(self, 'client_address', ['unknown'])[0] if hasattr(self, 'client_address') else 'unknown'
             
-            if any(ssl_term in error_str for ssl_term in ['ssl', 'tls', 'handshake', 'wrong version']):
-                logger.warning(f"🔒 [{self.request_id}] SSL/TLS connection attempt from {client_ip} on HTTP port")
-                logger.info(f"💡 [{self.request_id}] Hint: Client should use HTTP (not HTTPS) for this endpoint")
+            if any(ssl_term in error_str for ssl_term in _SSL_ERROR_TERMS):
+                logger.warning("🔒 [%s] SSL/TLS connection attempt from %s on HTTP port", self.connection_id, client_ip)
+                logger.info("💡 [%s] Hint: Client should use HTTP (not HTTPS) for this endpoint", self.connection_id)
             else:
-                logger.warning(f"⚠️ [{self.request_id}] Connection setup failed from {client_ip}: {e}")
+                logger.warning("⚠️ [%s] Connection setup failed from %s: %s", self.connection_id, client_ip, e)
             raise
+        
+        # Listeners defer the TLS handshake so a slow client only holds this thread
+        if isinstance(self.connection, ssl.SSLSocket):
+            try:
+                self.connection.do_handshake()
+            except OSError as e:
+                logger.warning("🔒 [%s] TLS handshake with %s failed: %s", self.connection_id, client_ip, e)
+                raise
+        logger.debug("🔗 [%s] Connection established from %s", self.connection_id, client_ip)
+    
+    def send_json_payload(self, status_code, body: bytes, length_line: Optional[bytes] = None,
+                          etag: Optional[str] = None, gzipped_body: Optional[bytes] = None):
+        """Send a complete JSON response from already encoded bytes
+        
+        The fixed header lines are appended to the header buffer as one
+        pre-encoded block instead of going through send_header() per line.
+        Bodies of GZIP_MIN_SIZE bytes or more are gzipped when the client
+        accepts gzip in Accept-Encoding with a non-zero q-value, and carry
+        Vary: Accept-Encoding either way. Callers serving pre-built bodies can
+        pass the matching content_length_line() so it is not formatted per
+        request, their gzip_body() so it is not compressed per request, and an
+        etag_for() value so a 200 whose ETag the client already holds
+        (If-None-Match) is answered with a bodiless 304.
+        """
+        header_lines = _JSON_HEADER_LINES
+        compressible = len(body) >= GZIP_MIN_SIZE
+        gzipped = compressible and _accepts_gzip(self.headers.get('Accept-Encoding', ''))
+        if compressible:
+            header_lines += b'Vary: Accept-Encoding\r\n'
+        if gzipped:
+            body = gzipped_body if gzipped_body is not None else gzip_body(body)
+            header_lines += b'Content-Encoding: gzip\r\n'
+            length_line = None
+        
+        keep_alive_line = b'' if self.close_connection else b'Connection: keep-alive\r\n'
+        
+        if etag is not None and status_code == 200:
+            if gzipped:
+                # The compressed representation needs its own validator
+                etag = etag[:-1] + '-gzip"'
+            etag_line = b'ETag: %s\r\n' % etag.encode('ascii')
+            if_none_match = self.headers.get('If-None-Match')
+            if if_none_match and (etag in if_none_match or if_none_match.strip() == '*'):
+                self.send_response(304)
+                self._headers_buffer.append(
+                    b'Cache-Control: no-cache\r\n' + etag_line +
+                    (b'Vary: Accept-Encoding\r\n' if compressible else b'') + keep_alive_line
+                )
+                self.end_headers()
+                return
+            header_lines += etag_line
+        
+        header_lines += keep_alive_line
+        
+        self.send_response(status_code)
+        self._headers_buffer.append(header_lines + (length_line or content_length_line(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def send_response(self, code, message=None):
+        """Send the status line, remembering the code for the completion log"""
+        self._status_sent = code
+        super().send_response(code, message)
+    
+    def address_string(self):
+        """Return the client IP captured when the connection was set up"""
+        return self.client_ip
+    
+    def date_time_string(self, timestamp=None):
+        """Return the Date header value, reusing the cached string for the current second"""
+        if timestamp is None:
+            return _http_date()
+        return super().date_time_string(timestamp)
     
     def log_message(self, format, *args):
         """Enhanced logging with intelligent filtering and request tracking"""
@@ -84,44 +245,45 @@ class RedfishRequestHandler(BaseHTTPRequestHandler):
             
             # Check for problematic content (binary data, SSL errors)
             if isinstance(message, str):
-                has_ssl_error = any(pattern in message for pattern in [
-                    'Bad request version', 'Bad request syntax', 'Bad HTTP/0.9 request'
-                ])
+                has_ssl_error = 'Bad ' in message and any(pattern in message for pattern in _BAD_PATTERNS)
                 
-                # Check for binary content
-                printable_chars = sum(c.isprintable() or c.isspace() for c in message)
-                total_chars = len(message)
-                has_binary_quotes = '"' in message and any(ord(c) > 127 for c in message if c != '"')
+                # Plain ASCII lines (the normal case) cannot contain binary content
+                if message.isascii() and message.isprintable():
+                    is_binary = False
+                else:
+                    printable_chars = sum(c.isprintable() or c.isspace() for c in message)
+                    total_chars = len(message)
+                    has_binary_quotes = '"' in message and any(ord(c) > 127 for c in message if c != '"')
+                    is_binary = total_chars > 0 and ((printable_chars / total_chars) < 0.5 or has_binary_quotes)
                 
                 # Filter problematic content
-                if total_chars > 0 and ((printable_chars / total_chars) < 0.5 or has_ssl_error or has_binary_quotes):
-                    if not hasattr(self.server, '_ssl_warnings'):
-                        self.server._ssl_warnings = set()
-                    
+                if has_ssl_error or is_binary:
                     if has_ssl_error and client_ip not in self.server._ssl_warnings:
-                        logger.warning(f"🚫 [{self.request_id}] {client_ip} - Malformed HTTP request or HTTPS on HTTP port")
-                        logger.info(f"💡 [{self.request_id}] Use HTTP protocol for this endpoint")
+                        logger.warning("🚫 [%s] %s - Malformed HTTP request or HTTPS on HTTP port", self.request_id, client_ip)
+                        logger.info("💡 [%s] Use HTTP protocol for this endpoint", self.request_id)
                         self.server._ssl_warnings.add(client_ip)
                     return
                 
             # Log normal requests with enhanced information
-            logger.info(f"🌐 [{self.request_id}] {client_ip} - {message}")
+            logger.info("🌐 [%s] %s - %s", self.request_id, client_ip, message)
             
         except Exception as e:
-            logger.debug(f"🔧 [{self.request_id}] Log filtering error: {e}")
+            logger.debug("🔧 [%s] Log filtering error: %s", self.request_id, e)
     
     def parse_request(self):
         """Enhanced request parsing with better SSL/TLS detection"""
+        self.request_id = str(uuid.uuid4())[:8]  # Short unique ID for this request
+        self._status_sent = None
         try:
             return super().parse_request()
         except Exception as e:
-            client_ip = getattr(self, 'client_address', ['unknown'])[0] if hasattr(self, 'client_address') else 'unknown'
+            client_ip = self.client_ip
             
             # Detect SSL/TLS handshake
-            if hasattr(self, 'raw_requestline') and self.raw_requestline:
-                if len(self.raw_requestline) > 0 and self.raw_requestline[0] == 0x16:
-                    logger.warning(f"🔐 [{self.request_id}] {client_ip} - SSL/TLS handshake detected on HTTP port")
-                    logger.info(f"💡 [{self.request_id}] Configure client to use HTTP (not HTTPS)")
+            if self.raw_requestline:
+                if self.raw_requestline[0] == 0x16:
+                    logger.warning("🔐 [%s] %s - SSL/TLS handshake detected on HTTP port", self.request_id, client_ip)
+                    logger.info("💡 [%s] Configure client to use HTTP (not HTTPS)", self.request_id)
                     
                     # Send helpful HTTP response
                     try:
@@ -134,46 +296,58 @@ class RedfishRequestHandler(BaseHTTPRequestHandler):
                         pass
                     return False
             
-            logger.debug(f"🔧 [{self.request_id}] Request parsing failed from {client_ip}: {e}")
+            logger.debug("🔧 [%s] Request parsing failed from %s: %s", self.request_id, client_ip, e)
             return False
     
     def _log_request_start(self, method, additional_info=None):
         """Log the start of a request with enhanced information"""
-        client_info = {
-            'ip': self.client_address[0],
-            'port': self.client_address[1],
-            'user_agent': self.headers.get('User-Agent', 'Unknown'),
-            'content_type': self.headers.get('Content-Type', 'None'),
-            'content_length': self.headers.get('Content-Length', '0')
-        }
+        logger.info("🚀 [%s] %s %s - Client: %s:%s (connection %s)", self.request_id, method, self.path,
+                    self.client_ip, self.client_address[1], self.connection_id)
         
-        logger.info(f"🚀 [{self.request_id}] {method} {self.path} - Client: {client_info['ip']}:{client_info['port']}")
-        logger.debug(f"🔍 [{self.request_id}] User-Agent: {client_info['user_agent']}")
-        logger.debug(f"📋 [{self.request_id}] Content-Type: {client_info['content_type']}, Length: {client_info['content_length']}")
-        
-        if additional_info:
-            for key, value in additional_info.items():
-                logger.debug(f"📝 [{self.request_id}] {key}: {value}")
-        
-        return client_info
+        # Header lookups scan the whole header list, so only do them when they will be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            headers = self.headers
+            logger.debug("🔍 [%s] User-Agent: %s", self.request_id, headers.get('User-Agent', 'Unknown'))
+            logger.debug("📋 [%s] Content-Type: %s, Length: %s", self.request_id,
+                         headers.get('Content-Type', 'None'), headers.get('Content-Length', '0'))
+            
+            if additional_info:
+                for key, value in additional_info.items():
+                    logger.debug("📝 [%s] %s: %s", self.request_id, key, value)
+    
+    def _log_request_body(self, method, body: bytes):
+        """Debug-log a request body, decoding it once for both the raw and parsed views"""
+        text = body.decode('utf-8', errors='replace')
+        logger.debug("📥 [%s] %s body (%d bytes): %s", self.request_id, method, len(body), text)
+        if self.headers.get('Content-Type', '').startswith('application/json'):
+            try:
+                logger.debug("📋 [%s] Parsed JSON: %s", self.request_id, dumps(loads(body), pretty=True).decode('utf-8'))
+            except ValueError as je:
+                logger.warning("⚠️ [%s] Invalid JSON in %s body: %s", self.request_id, method, je)
     
-    def _log_request_end(self, method, start_time, status_code=200, additional_info=None):
-        """Log the end of a request with performance metrics"""
+    def _log_request_end(self, method, start_time, status_code=None, additional_info=None):
+        """Log the end of a request with performance metrics
+        
+        Without an explicit status_code the status actually sent is logged,
+        so 304s and handler errors are not recorded as 200.
+        """
         duration = time.time() - start_time
+        if status_code is None:
+            status_code = self._status_sent or 200
         
         # Record in tracker
         request_tracker.record_request(method, self.path, duration, status_code)
         
         # Log completion
-        status_emoji = "✅" if 200 <= status_code < 300 else "⚠️" if 300 <= status_code < 400 else "❌"
-        logger.info(f"{status_emoji} [{self.request_id}] {method} {self.path} - {status_code} in {duration:.3f}s")
+        status_emoji = "✅" if 200 <= status_code < 300 or status_code == 304 else "⚠️" if 300 <= status_code < 400 else "❌"
+        logger.info("%s [%s] %s %s - %s in %.3fs", status_emoji, self.request_id, method, self.path, status_code, duration)
         
         if additional_info:
             for key, value in additional_info.items():
-                logger.debug(f"📊 [{self.request_id}] {key}: {value}")
+                logger.debug("📊 [%s] %s: %s", self.request_id, key, value)
         
         # Log performance metrics if enabled
-        log_performance_metric(logger, f"{method} {self.path}", duration, 200 <= status_code < 300,
+        log_performance_metric(logger, f"{method} {self.path}", duration, status_code < 400,
                               status_code=status_code, request_id=self.request_id)
     
     def do_GET(self):
@@ -181,7 +355,7 @@ class RedfishRequestHandler(BaseHTTPRequestHandler):
         start_time = time.time()
         
         try:
-            client_info = self._log_request_start('GET')
+            self._log_request_start('GET')
             
             with create_debug_context()('GET Request Processing'):
                 self.server.handler.handle_get_request(self)
@@ -190,9 +364,9 @@ class RedfishRequestHandler(BaseHTTPRequestHandler):
             
         except Exception as e:
             duration = time.time() - start_time
-            logger.error(f"❌ [{self.request_id}] GET {self.path} failed: {e}")
-            logger.error(f"🔧 [{self.request_id}] Exception: {type(e).__name__}: {str(e)}")
-            logger.debug(f"📍 [{self.request_id}] Stack trace:", exc_info=True)
+            logger.error("❌ [%s] GET %s failed: %s", self.request_id, self.path, e)
+            logger.error("🔧 [%s] Exception: %s: %s", self.request_id, type(e).__name__, str(e))
+            logger.debug("📍 [%s] Stack trace:", self.request_id, exc_info=True)
             
             self._log_request_end('GET', start_time, 500)
             self.send_error(500, "Internal Server Error")
@@ -206,34 +380,39 @@ class RedfishRequestHandler(BaseHTTPRequestHandler):
             content_length = int(self.headers.get('Content-Length', 0))
             post_data = None
             
+            if content_length > MAX_BODY:
+                logger.warning("🚫 [%s] POST body too large: %d bytes (limit %d)", self.request_id, content_length, MAX_BODY)
+                self._log_request_end('POST', start_time, 413)
+                self.send_error(413, "Payload Too Large")
+                return
+            
             if content_length > 0:
                 post_data = self.rfile.read(content_length)
-                logger.debug(f"� [{self.request_id}] POST body ({content_length} bytes): {post_data.decode('utf-8', errors='replace')}")
-                
-                # Parse JSON if possible
-                try:
-                    if self.headers.get('Content-Type', '').startswith('application/json'):
-                        json_data = json.loads(post_data.decode('utf-8'))
-                        logger.debug(f"📋 [{self.request_id}] Parsed JSON: {json.dumps(json_data, indent=2)}")
-                except json.JSONDecodeError as je:
-                    logger.warning(f"⚠️ [{self.request_id}] Invalid JSON in POST body: {je}")
+                # Decoding and re-dumping the body is only worth it when debugging;
+                # the resource handlers parse it themselves and reject bad JSON
+                if logger.isEnabledFor(logging.DEBUG):
+                    self._log_request_body('POST', post_data)
                 
-                # Reset stream for handler
-                import io
-                self.rfile = io.BytesIO(post_data)
-            
-            client_info = self._log_request_start('POST', {'body_size': content_length})
+            self._log_request_start('POST', {'body_size': content_length})
             
-            with create_debug_context()('POST Request Processing'):
-                self.server.handler.handle_post_request(self)
+            # Hand the buffered body to the handler, then restore the socket
+            # stream so the next request on a kept-alive connection is readable
+            sock_rfile = self.rfile
+            if post_data is not None:
+                self.rfile = io.BytesIO(post_data)
+            try:
+                with create_debug_context()('POST Request Processing'):
+                    self.server.handler.handle_post_request(self)
+            finally:
+                self.rfile = sock_rfile
             
             self._log_request_end('POST', start_time)
             
         except Exception as e:
             duration = time.time() - start_time
-            logger.error(f"❌ [{self.request_id}] POST {self.path} failed: {e}")
-            logger.error(f"🔧 [{self.request_id}] Exception: {type(e).__name__}: {str(e)}")
-            logger.debug(f"📍 [{self.request_id}] Stack trace:", exc_info=True)
+            logger.error("❌ [%s] POST %s failed: %s", self.request_id, self.path, e)
+            logger.error("🔧 [%s] Exception: %s: %s", self.request_id, type(e).__name__, str(e))
+            logger.debug("📍 [%s] Stack trace:", self.request_id, exc_info=True)
             
             self._log_request_end('POST', start_time, 500)
             self.send_error(500, "Internal Server Error")
@@ -247,34 +426,39 @@ class RedfishRequestHandler(BaseHTTPRequestHandler):
             content_length = int(self.headers.get('Content-Length', 0))
             patch_data = None
             
+            if content_length > MAX_BODY:
+                logger.warning("🚫 [%s] PATCH body too large: %d bytes (limit %d)", self.request_id, content_length, MAX_BODY)
+                self._log_request_end('PATCH', start_time, 413)
+                self.send_error(413, "Payload Too Large")
+                return
+            
             if content_length > 0:
                 patch_data = self.rfile.read(content_length)
-                logger.debug(f"� [{self.request_id}] PATCH body ({content_length} bytes): {patch_data.decode('utf-8', errors='replace')}")
-                
-                # Parse JSON if possible
-                try:
-                    if self.headers.get('Content-Type', '').startswith('application/json'):
-                        json_data = json.loads(patch_data.decode('utf-8'))
-                        logger.debug(f"📋 [{self.request_id}] Parsed JSON: {json.dumps(json_data, indent=2)}")
-                except json.JSONDecodeError as je:
-                    logger.warning(f"⚠️ [{self.request_id}] Invalid JSON in PATCH body: {je}")
+                # Decoding and re-dumping the body is only worth it when debugging;
+                # the resource handlers parse it themselves and reject bad JSON
+                if logger.isEnabledFor(logging.DEBUG):
+                    self._log_request_body('PATCH', patch_data)
                 
-                # Reset stream for handler
-                import io
-                self.rfile = io.BytesIO(patch_data)
-            
-            client_info = self._log_request_start('PATCH', {'body_size': content_length})
+            self._log_request_start('PATCH', {'body_size': content_length})
             
-            with create_debug_context()('PATCH Request Processing'):
-                self.server.handler.handle_patch_request(self)
+            # Hand the buffered body to the handler, then restore the socket
+            # stream so the next request on a kept-alive connection is readable
+            sock_rfile = self.rfile
+            if patch_data is not None:
+                self.rfile = io.BytesIO(patch_data)
+            try:
+                with create_debug_context()('PATCH Request Processing'):
+                    self.server.handler.handle_patch_request(self)
+            finally:
+                self.rfile = sock_rfile
             
             self._log_request_end('PATCH', start_time)
             
         except Exception as e:
             duration = time.time() - start_time
-            logger.error(f"❌ [{self.request_id}] PATCH {self.path} failed: {e}")
-            logger.error(f"🔧 [{self.request_id}] Exception: {type(e).__name__}: {str(e)}")
-            logger.debug(f"📍 [{self.request_id}] Stack trace:", exc_info=True)
+            logger.error("❌ [%s] PATCH %s failed: %s", self.request_id, self.path, e)
+            logger.error("🔧 [%s] Exception: %s: %s", self.request_id, type(e).__name__, str(e))
+            logger.debug("📍 [%s] Stack trace:", self.request_id, exc_info=True)
             
             self._log_request_end('PATCH', start_time, 500)
             self.send_error(500, "Internal Server Error")
@@ -284,7 +468,7 @@ class RedfishRequestHandler(BaseHTTPRequestHandler):
         start_time = time.time()
         
         try:
-            client_info = self._log_request_start('DELETE')
+            self._log_request_start('DELETE')
             
             with create_debug_context()('DELETE Request Processing'):
                 self.server.handler.handle_delete_request(self)
@@ -293,9 +477,9 @@ class RedfishRequestHandler(BaseHTTPRequestHandler):
             
         except Exception as e:
             duration = time.time() - start_time
-            logger.error(f"❌ [{self.request_id}] DELETE {self.path} failed: {e}")
-            logger.error(f"🔧 [{self.request_id}] Exception: {type(e).__name__}: {str(e)}")
-            logger.debug(f"📍 [{self.request_id}] Stack trace:", exc_info=True)
+            logger.error("❌ [%s] DELETE %s failed: %s", self.request_id, self.path, e)
+            logger.error("🔧 [%s] Exception: %s: %s", self.request_id, type(e).__name__, str(e))
+            logger.debug("📍 [%s] Stack trace:", self.request_id, exc_info=True)
             
             self._log_request_end('DELETE', start_time, 500)
             self.send_error(500, "Internal Server Error")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+JSON Response Helpers
+Shared response writers for the Redfish resource handlers.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from utils.serialization import dumps
+from .http_handler import GZIP_MIN_SIZE, content_length_line, etag_for, gzip_body
+
+
+def prebuilt_body(body: bytes) -> Tuple[bytes, bytes, str, Optional[bytes]]:
+    """Pair an already encoded static resource with its Content-Length line, ETag and gzipped form"""
+    gzipped_body = gzip_body(body) if len(body) >= GZIP_MIN_SIZE else None
+    return body, content_length_line(body), etag_for(body), gzipped_body
+
+
+def prebuilt_response(data: Dict) -> Tuple[bytes, bytes, str, Optional[bytes]]:
+    """Encode a static resource once, together with its Content-Length line, ETag and gzipped form"""
+    return prebuilt_body(dumps(data))
+
+
+# Error bodies for the fixed messages the Redfish handlers send, encoded once
+_ERROR_BYTES = {
+    (status_code, message): prebuilt_response({
+        "error": {
+            "code": f"Base.1.0.{status_code}",
+            "message": message
+        }
+    })
+    for status_code, message in (
+        (400, "Missing action data"),
+        (400, "Missing patch data"),
+        (400, "Missing credentials"),
+        (401, "Invalid credentials"),
+        (404, "Not Found"),
+        (404, "Task not found"),
+        (404, "Session not found"),
+        (404, "System not found"),
+        (404, "Manager not found"),
+        (404, "Chassis not found"),
+        (404, "Virtual media not found"),
+        (404, "Interface not found"),
+        (405, "Method not allowed"),
+        (500, "Internal Server Error"),
+    )
+}
+
+
+class JsonResponseMixin:
+    """Send JSON bodies and Redfish error payloads through the request handler"""
+    
+    def _send_json_response(self, request_handler, status_code: int, data: Dict):
+        """Send JSON response"""
+        self._send_json_bytes(request_handler, status_code, dumps(data))
+    
+    def _send_json_bytes(self, request_handler, status_code: int, body: bytes,
+                         length_line: Optional[bytes] = None, etag: Optional[str] = None,
+                         gzipped_body: Optional[bytes] = None):
+        """Send an already serialized JSON response"""
+        request_handler.send_json_payload(status_code, body, length_line, etag, gzipped_body)
+    
+    def _send_error_response(self, request_handler, status_code: int, message: str):
+        """Send error response"""
+        prebuilt = _ERROR_BYTES.get((status_code, message))
+        if prebuilt is not None:
+            self._send_json_bytes(request_handler, status_code, *prebuilt)
+            return
+        
+        error_data = {
+            "error": {
+                "code": f"Base.1.0.{status_code}",
+                "message": message
+            }
+        }
+        self._send_json_response(request_handler, status_code, error_data)
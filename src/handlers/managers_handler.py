@@ -4,39 +4,77 @@ Managers Handler
 Handles Redfish Managers endpoints for BMC management.
 """
 
-import json
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 from models.redfish_schemas import RedfishModels
+from .json_response import JsonResponseMixin, prebuilt_response
 
 logger = logging.getLogger(__name__)
 
+MANAGER_PREFIX = '/redfish/v1/Managers/'
+VIRTUAL_MEDIA_IDS = ('CD', 'Floppy')
 
-class ManagersHandler:
+# Last formatted manager DateTime, refreshed at most once per second
+_DT_CACHE = (0, '')
+
+
+def _now_iso() -> str:
+    """Return the current UTC time as ISO 8601, cached to one-second granularity"""
+    global _DT_CACHE
+    t = int(time.time())
+    cached_t, cached = _DT_CACHE
+    if t != cached_t:
+        cached = datetime.fromtimestamp(t, timezone.utc).isoformat()
+        _DT_CACHE = (t, cached)
+    return cached
+
+
+@lru_cache(maxsize=256)
+def _extract_manager_id(path: str) -> Optional[str]:
+    """Extract manager ID from path"""
+    parts = path.split('/')
+    if 'Managers' in parts:
+        managers_index = parts.index('Managers')
+        if len(parts) > managers_index + 1:
+            return parts[managers_index + 1]
+    return None
+
+
+@lru_cache(maxsize=256)
+def _vm_name_from_manager(manager_id: str) -> str:
+    """Map a manager ID ('<vm>-bmc') back to its VM name"""
+    return manager_id[:-4] if manager_id.endswith('-bmc') else manager_id
+
+
+class ManagersHandler(JsonResponseMixin):
     """Handler for Redfish Managers endpoints"""
     
     def __init__(self, vm_configs: Dict, vmware_clients: Dict):
         self.vm_configs = vm_configs
         self.vmware_clients = vmware_clients
+        self._static_responses = self._prebuild_static_responses()
         logger.info("🔧 Managers handler initialized")
     
     def handle_get(self, request_handler, path: str):
         """Handle GET requests for Managers"""
-        if path == '/redfish/v1/Managers':
-            # Managers collection
-            data = RedfishModels.get_managers_collection(list(self.vm_configs.keys()))
-            self._send_json_response(request_handler, 200, data)
-        elif '/redfish/v1/Managers/' in path:
+        prebuilt = self._static_responses.get(path)
+        if prebuilt is not None:
+            self._send_json_bytes(request_handler, 200, *prebuilt)
+        elif path.startswith(MANAGER_PREFIX):
             # Individual manager
-            manager_id = self._extract_manager_id(path)
+            manager_id = _extract_manager_id(path)
             if manager_id:
-                vm_name = manager_id.replace('-bmc', '') if manager_id.endswith('-bmc') else manager_id
+                vm_name = _vm_name_from_manager(manager_id)
                 if vm_name in self.vm_configs:
-                    if '/VirtualMedia' in path:
+                    # Sub-resource is whatever follows '/redfish/v1/Managers/<id>'
+                    subpath = path[len(MANAGER_PREFIX) + len(manager_id):]
+                    if subpath.startswith('/VirtualMedia'):
                         self._handle_virtual_media_get(request_handler, manager_id, path)
-                    elif '/EthernetInterfaces' in path:
+                    elif subpath.startswith('/EthernetInterfaces'):
                         self._handle_ethernet_interfaces_get(request_handler, manager_id, path)
                     else:
                         data = self._get_manager_info(manager_id)
@@ -48,18 +86,9 @@ class ManagersHandler:
         else:
             self._send_error_response(request_handler, 404, "Not Found")
     
-    def _extract_manager_id(self, path: str) -> Optional[str]:
-        """Extract manager ID from path"""
-        parts = path.split('/')
-        if 'Managers' in parts:
-            managers_index = parts.index('Managers')
-            if len(parts) > managers_index + 1:
-                return parts[managers_index + 1]
-        return None
-    
     def _get_manager_info(self, manager_id: str) -> Dict:
         """Get manager information"""
-        vm_name = manager_id.replace('-bmc', '') if manager_id.endswith('-bmc') else manager_id
+        vm_name = _vm_name_from_manager(manager_id)
         
         return {
             '@odata.type': '#Manager.v1_13_0.Manager',
@@ -76,7 +105,7 @@ class ManagersHandler:
                 'State': 'Enabled',
                 'Health': 'OK'
             },
-            'DateTime': datetime.now(timezone.utc).isoformat(),
+            'DateTime': _now_iso(),
             'DateTimeLocalOffset': '+00:00',
             'ServiceIdentification': {
                 'Product': 'VMware Redfish Server',
@@ -111,50 +140,135 @@ class ManagersHandler:
             }
         }
     
+    def _prebuild_static_responses(self) -> Dict[str, Tuple[bytes, bytes, str, Optional[bytes]]]:
+        """Pre-serialize the per-VM manager sub-resources that never change
+        
+        VirtualMedia and EthernetInterfaces payloads depend only on the manager
+        id, so they are rendered once here and served straight from this table,
+        along with the Managers collection for the fixed VM list.
+        """
+        prebuilt = {'/redfish/v1/Managers': prebuilt_response(RedfishModels.get_managers_collection(self.vm_configs))}
+        for vm_name in self.vm_configs:
+            manager_id = f'{vm_name}-bmc'
+            base = f'{MANAGER_PREFIX}{manager_id}'
+            resources = {
+                f'{base}/VirtualMedia': self._get_virtual_media_collection(manager_id),
+                f'{base}/EthernetInterfaces': self._get_ethernet_interfaces_collection(manager_id)
+            }
+            for media_id in VIRTUAL_MEDIA_IDS:
+                resources[f'{base}/VirtualMedia/{media_id}'] = self._get_virtual_media(manager_id, media_id)
+            resources[f'{base}/EthernetInterfaces/eth0'] = self._get_ethernet_interface(manager_id, 'eth0')
+            
+            for resource_path, data in resources.items():
+                prebuilt[resource_path] = prebuilt_response(data)
+        
+        logger.debug("📦 Pre-built %s static manager responses", len(prebuilt))
+        return prebuilt
+    
+    def _get_virtual_media_collection(self, manager_id: str) -> Dict:
+        """Get VirtualMedia collection"""
+        return {
+            '@odata.type': '#VirtualMediaCollection.VirtualMediaCollection',
+            '@odata.id': f'/redfish/v1/Managers/{manager_id}/VirtualMedia',
+            'Name': 'Virtual Media Services',
+            'Description': f'Virtual Media Services for {manager_id}',
+            'Members@odata.count': 2,
+            'Members': [
+                {
+                    '@odata.id': f'/redfish/v1/Managers/{manager_id}/VirtualMedia/CD'
+                },
+                {
+                    '@odata.id': f'/redfish/v1/Managers/{manager_id}/VirtualMedia/Floppy'
+                }
+            ]
+        }
+    
+    def _get_virtual_media(self, manager_id: str, media_id: str) -> Dict:
+        """Get an individual virtual media device"""
+        return {
+            '@odata.type': '#VirtualMedia.v1_3_0.VirtualMedia',
+            '@odata.id': f'/redfish/v1/Managers/{manager_id}/VirtualMedia/{media_id}',
+            'Id': media_id,
+            'Name': f'Virtual {media_id}',
+            'Description': f'Virtual {media_id} for {manager_id}',
+            'MediaTypes': ['CD', 'DVD'] if media_id == 'CD' else ['Floppy'],
+            'Connected': False,
+            'Inserted': False,
+            'WriteProtected': True,
+            'ConnectedVia': 'NotConnected',
+            'Actions': {
+                '#VirtualMedia.InsertMedia': {
+                    'target': f'/redfish/v1/Managers/{manager_id}/VirtualMedia/{media_id}/Actions/VirtualMedia.InsertMedia'
+                },
+                '#VirtualMedia.EjectMedia': {
+                    'target': f'/redfish/v1/Managers/{manager_id}/VirtualMedia/{media_id}/Actions/VirtualMedia.EjectMedia'
+                }
+            }
+        }
+    
+    def _get_ethernet_interfaces_collection(self, manager_id: str) -> Dict:
+        """Get EthernetInterfaces collection"""
+        return {
+            '@odata.type': '#EthernetInterfaceCollection.EthernetInterfaceCollection',
+            '@odata.id': f'/redfish/v1/Managers/{manager_id}/EthernetInterfaces',
+            'Name': 'Ethernet Network Interface Collection',
+            'Description': f'Ethernet Network Interface Collection for {manager_id}',
+            'Members@odata.count': 1,
+            'Members': [
+                {
+                    '@odata.id': f'/redfish/v1/Managers/{manager_id}/EthernetInterfaces/eth0'
+                }
+            ]
+        }
+    
+    def _get_ethernet_interface(self, manager_id: str, interface_id: str) -> Dict:
+        """Get an individual ethernet interface"""
+        return {
+            '@odata.type': '#EthernetInterface.v1_6_0.EthernetInterface',
+            '@odata.id': f'/redfish/v1/Managers/{manager_id}/EthernetInterfaces/{interface_id}',
+            'Id': interface_id,
+            'Name': 'Management Network Interface',
+            'Description': f'Management Network Interface for {manager_id}',
+            'Status': {
+                'State': 'Enabled',
+                'Health': 'OK'
+            },
+            'InterfaceEnabled': True,
+            'PermanentMACAddress': '00:50:56:84:56:78',
+            'MACAddress': '00:50:56:84:56:78',
+            'SpeedMbps': 1000,
+            'FullDuplex': True,
+            'HostName': f'{manager_id}.local',
+            'FQDN': f'{manager_id}.local',
+            'IPv4Addresses': [
+                {
+                    'Address': '192.168.1.100',
+                    'SubnetMask': '255.255.255.0',
+                    'AddressOrigin': 'Static',
+                    'Gateway': '192.168.1.1'
+                }
+            ],
+            'IPv6AddressOriginCounts': {
+                'LinkLocal': 0,
+                'Static': 0,
+                'DHCP': 0,
+                'SLAAC': 0
+            },
+            'IPv6StaticAddresses': [],
+            'NameServers': ['8.8.8.8', '8.8.4.4']
+        }
+    
     def _handle_virtual_media_get(self, request_handler, manager_id: str, path: str):
         """Handle VirtualMedia GET requests"""
         if path.endswith('/VirtualMedia'):
             # VirtualMedia collection
-            data = {
-                '@odata.type': '#VirtualMediaCollection.VirtualMediaCollection',
-                '@odata.id': f'/redfish/v1/Managers/{manager_id}/VirtualMedia',
-                'Name': 'Virtual Media Services',
-                'Description': f'Virtual Media Services for {manager_id}',
-                'Members@odata.count': 2,
-                'Members': [
-                    {
-                        '@odata.id': f'/redfish/v1/Managers/{manager_id}/VirtualMedia/CD'
-                    },
-                    {
-                        '@odata.id': f'/redfish/v1/Managers/{manager_id}/VirtualMedia/Floppy'
-                    }
-                ]
-            }
+            data = self._get_virtual_media_collection(manager_id)
             self._send_json_response(request_handler, 200, data)
         elif '/VirtualMedia/' in path:
             # Individual virtual media
             media_id = path.split('/')[-1]
-            if media_id in ['CD', 'Floppy']:
-                data = {
-                    '@odata.type': '#VirtualMedia.v1_3_0.VirtualMedia',
-                    '@odata.id': f'/redfish/v1/Managers/{manager_id}/VirtualMedia/{media_id}',
-                    'Id': media_id,
-                    'Name': f'Virtual {media_id}',
-                    'Description': f'Virtual {media_id} for {manager_id}',
-                    'MediaTypes': ['CD', 'DVD'] if media_id == 'CD' else ['Floppy'],
-                    'Connected': False,
-                    'Inserted': False,
-                    'WriteProtected': True,
-                    'ConnectedVia': 'NotConnected',
-                    'Actions': {
-                        '#VirtualMedia.InsertMedia': {
-                            'target': f'/redfish/v1/Managers/{manager_id}/VirtualMedia/{media_id}/Actions/VirtualMedia.InsertMedia'
-                        },
-                        '#VirtualMedia.EjectMedia': {
-                            'target': f'/redfish/v1/Managers/{manager_id}/VirtualMedia/{media_id}/Actions/VirtualMedia.EjectMedia'
-                        }
-                    }
-                }
+            if media_id in VIRTUAL_MEDIA_IDS:
+                data = self._get_virtual_media(manager_id, media_id)
                 self._send_json_response(request_handler, 200, data)
             else:
                 self._send_error_response(request_handler, 404, "Virtual media not found")
@@ -165,78 +279,15 @@ class ManagersHandler:
         """Handle EthernetInterfaces GET requests"""
         if path.endswith('/EthernetInterfaces'):
             # EthernetInterfaces collection
-            data = {
-                '@odata.type': '#EthernetInterfaceCollection.EthernetInterfaceCollection',
-                '@odata.id': f'/redfish/v1/Managers/{manager_id}/EthernetInterfaces',
-                'Name': 'Ethernet Network Interface Collection',
-                'Description': f'Ethernet Network Interface Collection for {manager_id}',
-                'Members@odata.count': 1,
-                'Members': [
-                    {
-                        '@odata.id': f'/redfish/v1/Managers/{manager_id}/EthernetInterfaces/eth0'
-                    }
-                ]
-            }
+            data = self._get_ethernet_interfaces_collection(manager_id)
             self._send_json_response(request_handler, 200, data)
         elif '/EthernetInterfaces/' in path:
             # Individual ethernet interface
             interface_id = path.split('/')[-1]
             if interface_id == 'eth0':
-                data = {
-                    '@odata.type': '#EthernetInterface.v1_6_0.EthernetInterface',
-                    '@odata.id': f'/redfish/v1/Managers/{manager_id}/EthernetInterfaces/{interface_id}',
-                    'Id': interface_id,
-                    'Name': 'Management Network Interface',
-                    'Description': f'Management Network Interface for {manager_id}',
-                    'Status': {
-                        'State': 'Enabled',
-                        'Health': 'OK'
-                    },
-                    'InterfaceEnabled': True,
-                    'PermanentMACAddress': '00:50:56:84:56:78',
-                    'MACAddress': '00:50:56:84:56:78',
-                    'SpeedMbps': 1000,
-                    'FullDuplex': True,
-                    'HostName': f'{manager_id}.local',
-                    'FQDN': f'{manager_id}.local',
-                    'IPv4Addresses': [
-                        {
-                            'Address': '192.168.1.100',
-                            'SubnetMask': '255.255.255.0',
-                            'AddressOrigin': 'Static',
-                            'Gateway': '192.168.1.1'
-                        }
-                    ],
-                    'IPv6AddressOriginCounts': {
-                        'LinkLocal': 0,
-                        'Static': 0,
-                        'DHCP': 0,
-                        'SLAAC': 0
-                    },
-                    'IPv6StaticAddresses': [],
-                    'NameServers': ['8.8.8.8', '8.8.4.4']
-                }
+                data = self._get_ethernet_interface(manager_id, interface_id)
                 self._send_json_response(request_handler, 200, data)
             else:
                 self._send_error_response(request_handler, 404, "Interface not found")
         else:
             self._send_error_response(request_handler, 404, "Not Found")
-    
-    def _send_json_response(self, request_handler, status_code: int, data: Dict):
-        """Send JSON response"""
-        json_data = json.dumps(data, indent=2)
-        request_handler.send_response(status_code)
-        request_handler.send_header('Content-Type', 'application/json')
-        request_handler.send_header('Content-Length', str(len(json_data)))
-        request_handler.end_headers()
-        request_handler.wfile.write(json_data.encode('utf-8'))
-    
-    def _send_error_response(self, request_handler, status_code: int, message: str):
-        """Send error response"""
-        error_data = {
-            "error": {
-                "code": f"Base.1.0.{status_code}",
-                "message": message
-            }
-        }
-        self._send_json_response(request_handler, status_code, error_data)
@@ -7,16 +7,19 @@ Note: This application is AI-generated.
 Routes requests to appropriate handlers and manages the overall Redfish protocol.
 """
 
-import json
 import logging
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional
-from urllib.parse import urlparse, parse_qs
 
 from auth.manager import AuthenticationManager
 from tasks.manager import TaskManager
 from models.redfish_schemas import RedfishModels
+from utils.serialization import dumps, loads
 from vmware_client import VMwareClient
+from .http_handler import get_request_statistics
+from .json_response import JsonResponseMixin, prebuilt_body
 from .systems_handler import SystemsHandler
 from .managers_handler import ManagersHandler
 from .chassis_handler import ChassisHandler
@@ -24,8 +27,43 @@ from .update_service_handler import UpdateServiceHandler
 
 logger = logging.getLogger(__name__)
 
+REDFISH_ROOT = '/redfish/v1/'
+SERVICE_ROOT_PATHS = frozenset(('/redfish/v1/', '/redfish/v1'))
+HEALTH_PATHS = frozenset(('/redfish/v1/health', '/redfish/v1/health/'))
+TASK_SERVICE_PATH = '/redfish/v1/TaskService'
+TASKS_PATH = '/redfish/v1/TaskService/Tasks'
+SESSION_SERVICE_PATH = '/redfish/v1/SessionService'
+SESSIONS_PATH = '/redfish/v1/SessionService/Sessions'
+SESSION_MEMBER_PREFIX = SESSIONS_PATH + '/'
+_TASK_ID_RE = re.compile(r'^/redfish/v1/TaskService/Tasks/([^/]+)$')
+_SESSION_ID_RE = re.compile(r'^/redfish/v1/SessionService/Sessions/([^/]+)$')
 
-class RedfishHandler:
+# Upper bound on concurrent vCenter logins during startup
+MAX_CONNECT_WORKERS = 16
+
+# Metal3/Ironic client and inspection-endpoint detection for diagnostic logging
+_UA_METAL3_RE = re.compile(r'ironic|metal3', re.IGNORECASE)
+_CRIT_PATH_RE = re.compile(r'/(?:UpdateService|TaskService|FirmwareInventory|SoftwareInventory|Storage|Bios)')
+_CRIT_RESPONSE_RE = re.compile(r'/(?:UpdateService|FirmwareInventory|TaskService)')
+
+
+def _route_segment(path: str) -> Optional[str]:
+    """Return the first path segment after /redfish/v1/ (e.g. 'Systems')"""
+    if not path.startswith(REDFISH_ROOT):
+        return None
+    return path[len(REDFISH_ROOT):].partition('/')[0].partition('?')[0]
+
+
+# Body of the 401 challenge, identical for every unauthenticated request
+_AUTH_CHALLENGE_BODY = dumps({
+    "error": {
+        "code": "Base.1.0.401",
+        "message": "Authentication required"
+    }
+})
+
+
+class RedfishHandler(JsonResponseMixin):
     """Main Redfish protocol handler"""
     
     def __init__(self, vm_configs, config=None):
@@ -43,92 +81,161 @@ class RedfishHandler:
         self.chassis_handler = ChassisHandler(self.vm_configs, self.vmware_clients)
         self.update_service_handler = UpdateServiceHandler(self.vm_configs, self.vmware_clients, self.task_manager)
         
-        # Initialize VMware clients for each VM
-        for vm_name, vm_config in self.vm_configs.items():
-            try:
-                self.vmware_clients[vm_name] = VMwareClient(
+        # Constant payloads polled by Metal3/Ironic, encoded compactly at import
+        self._service_root_response = prebuilt_body(RedfishModels.get_service_root_bytes())
+        self._session_service_response = prebuilt_body(RedfishModels.get_session_service_bytes())
+        
+        # Dispatch tables keyed on the first segment after /redfish/v1/
+        self._get_routes = {
+            'Systems': self.systems_handler.handle_get,
+            'Managers': self.managers_handler.handle_get,
+            'Chassis': self.chassis_handler.handle_get,
+            'UpdateService': self.update_service_handler.handle_get,
+            'TaskService': self._handle_task_service,
+            'SessionService': self._handle_session_service
+        }
+        self._post_routes = {
+            'Systems': self.systems_handler.handle_post
+        }
+        self._patch_routes = {
+            'Systems': self.systems_handler.handle_patch
+        }
+        self._delete_routes = {
+            'SessionService': self._handle_session_deletion
+        }
+        
+        # Exact-path resources under TaskService and SessionService
+        self._task_routes = {
+            TASK_SERVICE_PATH: self._send_task_service,
+            TASKS_PATH: self._send_task_collection
+        }
+        self._session_routes = {
+            SESSION_SERVICE_PATH: self._send_session_service,
+            SESSIONS_PATH: self._send_session_collection
+        }
+        
+        # Initialize VMware clients; VMs with identical vCenter connection settings
+        # (host, port, account, password and certificate verification) share one
+        # session, and the distinct logins run concurrently
+        if self.vm_configs:
+            pool_keys = {
+                vm_name: (
                     vm_config['vcenter_host'],
+                    vm_config.get('vcenter_port', 443),
                     vm_config['vcenter_user'],
                     vm_config['vcenter_password'],
-                    disable_ssl=vm_config.get('disable_ssl', True)
+                    vm_config.get('disable_ssl', True)
                 )
-                logger.info(f"✅ VMware client initialized for VM: {vm_name}")
-            except Exception as e:
-                logger.error(f"❌ Failed to initialize VMware client for {vm_name}: {e}")
+                for vm_name, vm_config in self.vm_configs.items()
+            }
+            distinct_keys = list(dict.fromkeys(pool_keys.values()))
+            
+            pooled_clients = {}
+            with ThreadPoolExecutor(max_workers=min(MAX_CONNECT_WORKERS, len(distinct_keys)),
+                                    thread_name_prefix='VMwareConnect') as executor:
+                futures = {
+                    key: executor.submit(
+                        VMwareClient,
+                        key[0],
+                        key[2],
+                        key[3],
+                        port=key[1],
+                        disable_ssl=key[4]
+                    )
+                    for key in distinct_keys
+                }
+                for key, future in futures.items():
+                    try:
+                        pooled_clients[key] = future.result()
+                    except Exception as e:
+                        logger.error("❌ Failed to initialize VMware client for %s@%s:%s: %s", key[2], key[0], key[1], e)
+            
+            # Assign in configuration order so client iteration stays stable
+            for vm_name, key in pool_keys.items():
+                client = pooled_clients.get(key)
+                if client is not None:
+                    self.vmware_clients[vm_name] = client
+                    logger.info("✅ VMware client initialized for VM: %s", vm_name)
+                else:
+                    logger.error("❌ No VMware client available for VM: %s", vm_name)
+            logger.info("🔗 %s VMs share %s vCenter sessions", len(self.vmware_clients), len(pooled_clients))
         
-        logger.info(f"🚀 Redfish handler initialized for {len(self.vm_configs)} VMs")
+        logger.info("🚀 Redfish handler initialized for %s VMs", len(self.vm_configs))
     
     def handle_get_request(self, request_handler):
         """Handle GET requests with enhanced Metal3/Ironic logging"""
         path = request_handler.path
-        client_ip = request_handler.client_address[0]
-        user_agent = request_handler.headers.get('User-Agent', 'Unknown')
+        headers = request_handler.headers
         
         # Enhanced logging for Metal3/Ironic debugging
-        logger.info(f"🔍 GET {path} from {client_ip}")
-        logger.debug(f"🤖 User-Agent: {user_agent}")
-        logger.debug(f"🎯 Processing GET request for path: {path}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🔍 GET %s from %s", path, request_handler.client_ip)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🤖 User-Agent: %s", headers.get('User-Agent', 'Unknown'))
+            logger.debug("🎯 Processing GET request for path: %s", path)
         
-        # Metal3/Ironic specific detection
-        if 'ironic' in user_agent.lower() or 'metal3' in user_agent.lower():
-            logger.warning(f"🔧 METAL3/IRONIC REQUEST DETECTED: {path}")
-            logger.warning(f"🔧 This request is from Metal3/Ironic - ensure it succeeds!")
-            
-        # Check for common Metal3/Ironic inspection patterns
-        if any(pattern in path for pattern in ['/UpdateService', '/TaskService', '/FirmwareInventory', '/SoftwareInventory', '/Storage', '/Bios']):
-            logger.warning(f"🔄 CRITICAL METAL3 INSPECTION ENDPOINT: {path}")
-            logger.warning(f"🔄 Metal3 is checking this endpoint - response must be valid!")
+        if logger.isEnabledFor(logging.WARNING):
+            user_agent = headers.get('User-Agent', 'Unknown')
+            warning = logger.warning
+            # Metal3/Ironic specific detection
+            if _UA_METAL3_RE.search(user_agent):
+                warning("🔧 METAL3/IRONIC REQUEST DETECTED: %s", path)
+                warning("🔧 This request is from Metal3/Ironic - ensure it succeeds!")
+                
+            # Check for common Metal3/Ironic inspection patterns
+            if _CRIT_PATH_RE.search(path):
+                warning("🔄 CRITICAL METAL3 INSPECTION ENDPOINT: %s", path)
+                warning("🔄 Metal3 is checking this endpoint - response must be valid!")
         
         try:
             # Route the request
             self._route_get_request(request_handler, path)
         except Exception as e:
-            logger.error(f"❌ Error processing GET request {path}: {e}")
+            logger.error("❌ Error processing GET request %s: %s", path, e)
             self._send_error_response(request_handler, 500, "Internal Server Error")
     
     def handle_post_request(self, request_handler):
         """Handle POST requests"""
         path = request_handler.path
-        logger.info(f"📝 POST {path}")
+        logger.info("📝 POST %s", path)
         
         try:
             self._route_post_request(request_handler, path)
         except Exception as e:
-            logger.error(f"❌ Error processing POST request {path}: {e}")
+            logger.error("❌ Error processing POST request %s: %s", path, e)
             self._send_error_response(request_handler, 500, "Internal Server Error")
     
     def handle_patch_request(self, request_handler):
         """Handle PATCH requests"""
         path = request_handler.path
-        logger.info(f"🔧 PATCH {path}")
+        logger.info("🔧 PATCH %s", path)
         
         try:
             self._route_patch_request(request_handler, path)
         except Exception as e:
-            logger.error(f"❌ Error processing PATCH request {path}: {e}")
+            logger.error("❌ Error processing PATCH request %s: %s", path, e)
             self._send_error_response(request_handler, 500, "Internal Server Error")
     
     def handle_delete_request(self, request_handler):
         """Handle DELETE requests"""
         path = request_handler.path
-        logger.info(f"🗑️ DELETE {path}")
+        logger.info("🗑️ DELETE %s", path)
         
         try:
             self._route_delete_request(request_handler, path)
         except Exception as e:
-            logger.error(f"❌ Error processing DELETE request {path}: {e}")
+            logger.error("❌ Error processing DELETE request %s: %s", path, e)
             self._send_error_response(request_handler, 500, "Internal Server Error")
     
     def _route_get_request(self, request_handler, path):
         """Route GET requests to appropriate handlers"""
         # Service root - always public
-        if path == '/redfish/v1/' or path == '/redfish/v1':
-            data = RedfishModels.get_service_root()
-            self._send_json_response(request_handler, 200, data)
+        if path in SERVICE_ROOT_PATHS:
+            self._send_json_bytes(request_handler, 200, *self._service_root_response)
             return
         
         # Health endpoint - public for monitoring
-        if path == '/redfish/v1/health' or path == '/redfish/v1/health/':
+        if path in HEALTH_PATHS:
             self._handle_health_endpoint(request_handler)
             return
         
@@ -139,37 +246,22 @@ class RedfishHandler:
             return
         
         # Route to specific handlers
-        if path.startswith('/redfish/v1/Systems'):
-            self.systems_handler.handle_get(request_handler, path)
-        elif path.startswith('/redfish/v1/Managers'):
-            self.managers_handler.handle_get(request_handler, path)
-        elif path.startswith('/redfish/v1/Chassis'):
-            self.chassis_handler.handle_get(request_handler, path)
-        elif path.startswith('/redfish/v1/UpdateService'):
-            self.update_service_handler.handle_get(request_handler, path)
-        elif path.startswith('/redfish/v1/TaskService'):
-            self._handle_task_service(request_handler, path)
-        elif path.startswith('/redfish/v1/SessionService'):
-            self._handle_session_service(request_handler, path)
-        else:
-            self._send_error_response(request_handler, 404, "Not Found")
+        self._dispatch(self._get_routes, request_handler, path)
     
     def _route_post_request(self, request_handler, path):
         """Route POST requests to appropriate handlers"""
-        # Most POST requests require authentication
-        if not path.startswith('/redfish/v1/SessionService/Sessions'):
-            authenticated, username = self.auth_manager.authenticate_request(request_handler)
-            if not authenticated:
-                self._send_auth_challenge(request_handler)
-                return
+        # Session login is the only POST that does not require authentication
+        if path.startswith(SESSIONS_PATH):
+            self._handle_session_creation(request_handler)
+            return
+        
+        authenticated, username = self.auth_manager.authenticate_request(request_handler)
+        if not authenticated:
+            self._send_auth_challenge(request_handler)
+            return
         
         # Route to specific handlers
-        if path.startswith('/redfish/v1/Systems'):
-            self.systems_handler.handle_post(request_handler, path)
-        elif path.startswith('/redfish/v1/SessionService/Sessions'):
-            self._handle_session_creation(request_handler)
-        else:
-            self._send_error_response(request_handler, 404, "Not Found")
+        self._dispatch(self._post_routes, request_handler, path)
     
     def _route_patch_request(self, request_handler, path):
         """Route PATCH requests to appropriate handlers"""
@@ -179,10 +271,7 @@ class RedfishHandler:
             return
         
         # Route to specific handlers
-        if path.startswith('/redfish/v1/Systems'):
-            self.systems_handler.handle_patch(request_handler, path)
-        else:
-            self._send_error_response(request_handler, 404, "Not Found")
+        self._dispatch(self._patch_routes, request_handler, path)
     
     def _route_delete_request(self, request_handler, path):
         """Route DELETE requests to appropriate handlers"""
@@ -192,22 +281,26 @@ class RedfishHandler:
             return
         
         # Route to specific handlers
-        if path.startswith('/redfish/v1/SessionService/Sessions'):
-            self._handle_session_deletion(request_handler, path)
+        self._dispatch(self._delete_routes, request_handler, path)
+    
+    def _dispatch(self, routes: Dict, request_handler, path: str):
+        """Call the route handler registered for the path's top-level resource"""
+        route = routes.get(_route_segment(path))
+        if route:
+            route(request_handler, path)
         else:
             self._send_error_response(request_handler, 404, "Not Found")
     
     def _handle_task_service(self, request_handler, path):
         """Handle TaskService requests"""
-        if path == '/redfish/v1/TaskService':
-            data = self.task_manager.get_task_service()
-            self._send_json_response(request_handler, 200, data)
-        elif path == '/redfish/v1/TaskService/Tasks':
-            data = self.task_manager.list_tasks()
-            self._send_json_response(request_handler, 200, data)
-        elif '/TaskService/Tasks/' in path:
-            task_id = path.split('/')[-1]
-            task = self.task_manager.get_task(task_id)
+        route = self._task_routes.get(path)
+        if route:
+            route(request_handler)
+            return
+        
+        match = _TASK_ID_RE.match(path)
+        if match:
+            task = self.task_manager.get_task(match.group(1))
             if task:
                 self._send_json_response(request_handler, 200, task)
             else:
@@ -217,15 +310,14 @@ class RedfishHandler:
     
     def _handle_session_service(self, request_handler, path):
         """Handle SessionService requests"""
-        if path == '/redfish/v1/SessionService':
-            data = RedfishModels.get_session_service()
-            self._send_json_response(request_handler, 200, data)
-        elif path == '/redfish/v1/SessionService/Sessions':
-            data = self.auth_manager.list_sessions()
-            self._send_json_response(request_handler, 200, data)
-        elif '/SessionService/Sessions/' in path:
-            session_id = path.split('/')[-1]
-            session = self.auth_manager.get_session(session_id)
+        route = self._session_routes.get(path)
+        if route:
+            route(request_handler)
+            return
+        
+        match = _SESSION_ID_RE.match(path)
+        if match:
+            session = self.auth_manager.get_session(match.group(1))
             if session:
                 self._send_json_response(request_handler, 200, session)
             else:
@@ -233,13 +325,29 @@ class RedfishHandler:
         else:
             self._send_error_response(request_handler, 404, "Not Found")
     
+    def _send_task_service(self, request_handler):
+        """Send the TaskService resource"""
+        self._send_json_response(request_handler, 200, self.task_manager.get_task_service())
+    
+    def _send_task_collection(self, request_handler):
+        """Send the Tasks collection"""
+        self._send_json_response(request_handler, 200, self.task_manager.list_tasks())
+    
+    def _send_session_service(self, request_handler):
+        """Send the SessionService resource"""
+        self._send_json_bytes(request_handler, 200, *self._session_service_response)
+    
+    def _send_session_collection(self, request_handler):
+        """Send the Sessions collection"""
+        self._send_json_response(request_handler, 200, self.auth_manager.list_sessions())
+    
     def _handle_session_creation(self, request_handler):
         """Handle session creation"""
         try:
             content_length = int(request_handler.headers.get('Content-Length', 0))
             if content_length > 0:
                 post_data = request_handler.rfile.read(content_length)
-                data = json.loads(post_data.decode('utf-8'))
+                data = loads(post_data)
                 
                 username = data.get('UserName', 'admin')
                 password = data.get('Password', 'password')
@@ -253,12 +361,16 @@ class RedfishHandler:
             else:
                 self._send_error_response(request_handler, 400, "Missing credentials")
         except Exception as e:
-            logger.error(f"❌ Session creation error: {e}")
+            logger.error("❌ Session creation error: %s", e)
             self._send_error_response(request_handler, 500, "Internal Server Error")
     
     def _handle_session_deletion(self, request_handler, path):
         """Handle session deletion"""
-        session_id = path.split('/')[-1]
+        if not path.startswith(SESSION_MEMBER_PREFIX):
+            self._send_error_response(request_handler, 404, "Not Found")
+            return
+        
+        session_id = path.rpartition('/')[2]
         if self.auth_manager.delete_session(session_id):
             request_handler.send_response(204)
             request_handler.end_headers()
@@ -268,73 +380,60 @@ class RedfishHandler:
     def _send_json_response(self, request_handler, status_code, data):
         """Send JSON response with enhanced debugging"""
         try:
-            logger.debug(f"📤 Preparing JSON response: status={status_code}")
-            
-            json_data = json.dumps(data, indent=2)
-            json_size = len(json_data)
-            
-            logger.debug(f"📤 JSON payload size: {json_size} bytes")
+            json_bytes = dumps(data)
+            is_enabled = logger.isEnabledFor
             
-            # Log critical responses at warning level for Metal3 debugging
-            if status_code >= 400:
-                logger.error(f"❌ ERROR RESPONSE: {status_code}")
-                logger.error(f"❌ Response data: {json_data[:500]}...")  # First 500 chars
-            elif any(keyword in request_handler.path for keyword in ['/UpdateService', '/FirmwareInventory', '/TaskService']):
-                logger.warning(f"🔄 CRITICAL RESPONSE for Metal3: {status_code}")
-                logger.debug(f"🔄 Critical response data: {json_data[:200]}...")  # First 200 chars
-            else:
-                logger.debug(f"📤 Standard response: {status_code}")
-                logger.debug(f"📤 Response data: {json_data[:100]}...")  # First 100 chars
-            
-            request_handler.send_response(status_code)
-            request_handler.send_header('Content-Type', 'application/json')
-            request_handler.send_header('Content-Length', str(json_size))
-            request_handler.send_header('Cache-Control', 'no-cache')
-            request_handler.end_headers()
-            request_handler.wfile.write(json_data.encode('utf-8'))
+            # Diagnostics only run when their messages can actually be emitted
+            if status_code >= 400 or is_enabled(logging.DEBUG):
+                self._log_json_response(request_handler, status_code, json_bytes)
+            elif is_enabled(logging.WARNING) and _CRIT_RESPONSE_RE.search(request_handler.path):
+                logger.warning("🔄 CRITICAL RESPONSE for Metal3: %s", status_code)
             
-            logger.debug(f"✅ JSON response sent successfully: {status_code}")
+            request_handler.send_json_payload(status_code, json_bytes)
             
         except Exception as e:
-            logger.error(f"❌ CRITICAL: Failed to send JSON response: {e}")
-            logger.error(f"❌ Status code: {status_code}")
-            logger.error(f"❌ Data type: {type(data)}")
+            logger.error("❌ CRITICAL: Failed to send JSON response: %s", e)
+            logger.error("❌ Status code: %s", status_code)
+            logger.error("❌ Data type: %s", type(data))
             raise
     
-    def _send_error_response(self, request_handler, status_code, message):
-        """Send error response"""
-        error_data = {
-            "error": {
-                "code": f"Base.1.0.{status_code}",
-                "message": message
-            }
-        }
-        self._send_json_response(request_handler, status_code, error_data)
+    def _log_json_response(self, request_handler, status_code, json_bytes):
+        """Log response diagnostics for Metal3 debugging"""
+        logger.debug("📤 Preparing JSON response: status=%s", status_code)
+        logger.debug("📤 JSON payload size: %d bytes", len(json_bytes))
+        
+        # Log critical responses at warning level for Metal3 debugging
+        if status_code >= 400:
+            logger.error("❌ ERROR RESPONSE: %s", status_code)
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("❌ Response data: %s...", json_bytes[:500].decode('utf-8', 'replace'))  # First 500 bytes
+        elif _CRIT_RESPONSE_RE.search(request_handler.path):
+            logger.warning("🔄 CRITICAL RESPONSE for Metal3: %s", status_code)
+            logger.debug("🔄 Critical response data: %s...", json_bytes[:200].decode('utf-8', 'replace'))  # First 200 bytes
+        else:
+            logger.debug("📤 Standard response: %s", status_code)
+            logger.debug("📤 Response data: %s...", json_bytes[:100].decode('utf-8', 'replace'))  # First 100 bytes
+    
+    def _send_json_bytes(self, request_handler, status_code, body, length_line=None, etag=None, gzipped_body=None):
+        """Send an already serialized JSON response, logging errors as _send_json_response does"""
+        if status_code >= 400:
+            logger.error("❌ ERROR RESPONSE: %s", status_code)
+        super()._send_json_bytes(request_handler, status_code, body, length_line, etag, gzipped_body)
     
     def _send_auth_challenge(self, request_handler):
         """Send authentication challenge"""
         request_handler.send_response(401)
         request_handler.send_header('WWW-Authenticate', 'Basic realm="Redfish VMware Server"')
         request_handler.send_header('Content-Type', 'application/json')
+        request_handler.send_header('Content-Length', str(len(_AUTH_CHALLENGE_BODY)))
         request_handler.end_headers()
-        
-        error_data = {
-            "error": {
-                "code": "Base.1.0.401",
-                "message": "Authentication required"
-            }
-        }
-        request_handler.wfile.write(json.dumps(error_data).encode('utf-8'))
+        request_handler.wfile.write(_AUTH_CHALLENGE_BODY)
     
     def _handle_health_endpoint(self, request_handler):
         """Handle health monitoring endpoint with comprehensive statistics"""
         logger.debug("📊 Health endpoint requested")
         
         try:
-            # Import here to avoid circular imports
-            from handlers.http_handler import get_request_statistics
-            from redfish_server import health_monitor
-            
             # Collect health data
             health_data = {
                 "@odata.type": "#HealthInfo.v1_0_0.HealthInfo",
@@ -360,7 +459,7 @@ class RedfishHandler:
             
             # Get server statistics if available
             try:
-                server_stats = health_monitor.get_health_stats()
+                server_stats = request_handler.server.health_monitor.get_health_stats()
                 health_data["Statistics"] = server_stats
             except:
                 health_data["Statistics"] = {"error": "Server statistics not available"}
@@ -400,11 +499,11 @@ class RedfishHandler:
             health_data["ConnectedVMs"] = overall_connected
             health_data["TotalVMs"] = total_vms
             
-            logger.info(f"📊 Health check: {overall_connected}/{total_vms} VMs connected")
+            logger.info("📊 Health check: %s/%s VMs connected", overall_connected, total_vms)
             self._send_json_response(request_handler, 200, health_data)
             
         except Exception as e:
-            logger.error(f"❌ Error in health endpoint: {e}")
+            logger.error("❌ Error in health endpoint: %s", e)
             error_data = {
                 "error": {
                     "code": "Base.1.0.500",
@@ -423,10 +522,14 @@ class RedfishHandler:
         logger.info("🛑 Shutting down Redfish handler")
         self.task_manager.shutdown()
         
-        # Disconnect VMware clients
+        # Disconnect VMware clients; pooled clients are shared, so only once each
+        disconnected = set()
         for vm_name, client in self.vmware_clients.items():
+            if id(client) in disconnected:
+                continue
+            disconnected.add(id(client))
             try:
                 client.disconnect()
-                logger.info(f"🔌 Disconnected VMware client for: {vm_name}")
+                logger.info("🔌 Disconnected VMware client for: %s", vm_name)
             except Exception as e:
-                logger.error(f"❌ Error disconnecting VMware client for {vm_name}: {e}")
+                logger.error("❌ Error disconnecting VMware client for %s: %s", vm_name, e)
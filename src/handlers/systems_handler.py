@@ -4,43 +4,124 @@ Systems Handler
 Handles Redfish Computer Systems endpoints for VM management.
 """
 
-import json
 import logging
-from typing import Dict, Optional
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
-from models.redfish_schemas import RedfishModels
+from models.redfish_schemas import RedfishModels, translate_power_state
+from utils.serialization import loads
+from .json_response import JsonResponseMixin, prebuilt_response
 
 logger = logging.getLogger(__name__)
 
+SYSTEMS_PREFIX = '/redfish/v1/Systems/'
 
-class SystemsHandler:
+# Default seconds a VM power state read from vCenter is reused for repeated GETs
+POWER_STATE_TTL = 2.0
+
+# Seconds a VM that vCenter did not return stays reported as missing before it is queried again
+POWER_STATE_MISS_TTL = 10.0
+
+
+@lru_cache(maxsize=1024)
+def _parse_system_path(path: str) -> Tuple[Optional[str], Optional[str]]:
+    """Split a Systems path into (vm_name, sub-resource segment)"""
+    _, sep, tail = path.partition(SYSTEMS_PREFIX)
+    if not sep:
+        return None, None
+    vm_name, _, rest = tail.partition('/')
+    resource = rest.partition('/')[0]
+    return vm_name or None, resource or None
+
+
+@lru_cache(maxsize=1024)
+def _extract_vm_name(path: str) -> Optional[str]:
+    """Extract VM name from path"""
+    _, sep, tail = path.partition(SYSTEMS_PREFIX)
+    if not sep:
+        return None
+    return tail.partition('/')[0] or None
+
+
+@lru_cache(maxsize=256)
+def _system_uuid(vm_name: str) -> str:
+    """Derive the stable pseudo-UUID reported for a VM"""
+    tail4 = vm_name[-4:].ljust(4, '0')
+    return f'424d4f4e-{vm_name[-8:].ljust(8, "0")}-{tail4}-{tail4}-{vm_name[-12:].ljust(12, "0")}'
+
+
+class SystemsHandler(JsonResponseMixin):
     """Handler for Redfish Systems endpoints"""
     
+    # ComputerSystem.Reset ResetType -> VMwareClient method name
+    _RESET_DISPATCH = {
+        'On': 'power_on_vm',
+        'ForceOff': 'power_off_vm',
+        'GracefulShutdown': 'shutdown_vm',
+        'GracefulRestart': 'restart_vm',
+        'ForceRestart': 'reset_vm',
+    }
+    
     def __init__(self, vm_configs: Dict, vmware_clients: Dict, task_manager):
         self.vm_configs = vm_configs
         self.vmware_clients = vmware_clients
         self.task_manager = task_manager
+        # vm_name -> (monotonic expiry, Redfish PowerState)
+        self._power_cache: Dict[str, Tuple[float, str]] = {}
+        # Per-VM override via "power_cache_ttl" in the VM config; 0 disables caching
+        self._power_cache_ttl = {
+            vm_name: float(vm_config.get('power_cache_ttl', POWER_STATE_TTL))
+            for vm_name, vm_config in vm_configs.items()
+        }
+        # VMwareClient -> lock serializing its power refreshes, so the cold-cache
+        # burst right after startup waits on one vCenter query instead of issuing many
+        self._power_refresh_locks: Dict[object, threading.Lock] = {}
+        
+        # Sub-resources of /redfish/v1/Systems/{vm}, keyed by the path segment
+        # after the VM name; the bare VM path is the system itself
+        self._get_routes = {
+            'Bios': self._handle_bios_get,
+            'Storage': self._handle_storage_get,
+            'SecureBoot': self._handle_secure_boot_get,
+        }
+        self._patch_routes = {
+            'Bios': self._handle_bios_patch,
+            'SecureBoot': self._handle_secure_boot_patch,
+        }
+        
+        # Per-VM resource documents are static apart from PowerState, so each
+        # is built once (up front for configured VMs) and reused afterwards
+        self._system_tpl: Dict[str, Dict] = {}
+        self._resource_docs: Dict[Tuple[str, str], Dict] = {}
+        self._doc_builders = {
+            'Bios': self._build_bios,
+            'Storage': self._build_storage_collection,
+            'SecureBoot': self._build_secure_boot,
+        }
+        self._static_responses = self._prebuild_static_responses()
+        for vm_name in self.vm_configs:
+            self._system_tpl[vm_name] = self._build_system_template(vm_name)
         logger.info("💻 Systems handler initialized")
     
     def handle_get(self, request_handler, path: str):
         """Handle GET requests for Systems"""
-        if path == '/redfish/v1/Systems':
-            # Systems collection
-            data = RedfishModels.get_systems_collection(list(self.vm_configs.keys()))
-            self._send_json_response(request_handler, 200, data)
-        elif '/redfish/v1/Systems/' in path:
+        path = path.partition('?')[0]
+        prebuilt = self._static_responses.get(path)
+        if prebuilt is not None:
+            self._send_json_bytes(request_handler, 200, *prebuilt)
+        elif path.startswith(SYSTEMS_PREFIX):
             # Individual system
-            vm_name = self._extract_vm_name(path)
+            vm_name, resource = _parse_system_path(path)
             if vm_name and vm_name in self.vm_configs:
-                if '/Bios' in path:
-                    self._handle_bios_get(request_handler, vm_name, path)
-                elif '/Storage' in path:
-                    self._handle_storage_get(request_handler, vm_name, path)
-                elif '/SecureBoot' in path:
-                    self._handle_secure_boot_get(request_handler, vm_name, path)
-                else:
+                if resource is None:
                     data = self._get_system_info(vm_name)
                     self._send_json_response(request_handler, 200, data)
+                elif resource in self._get_routes:
+                    self._get_routes[resource](request_handler, vm_name, path)
+                else:
+                    self._send_error_response(request_handler, 404, "Not Found")
             else:
                 self._send_error_response(request_handler, 404, "System not found")
         else:
@@ -48,8 +129,9 @@ class SystemsHandler:
     
     def handle_post(self, request_handler, path: str):
         """Handle POST requests for Systems"""
+        path = path.partition('?')[0]
         if '/Actions/' in path:
-            vm_name = self._extract_vm_name(path)
+            vm_name = _extract_vm_name(path)
             if vm_name and vm_name in self.vm_configs:
                 self._handle_system_action(request_handler, vm_name, path)
             else:
@@ -59,147 +141,168 @@ class SystemsHandler:
     
     def handle_patch(self, request_handler, path: str):
         """Handle PATCH requests for Systems"""
-        vm_name = self._extract_vm_name(path)
+        path = path.partition('?')[0]
+        vm_name, resource = _parse_system_path(path)
         if vm_name and vm_name in self.vm_configs:
-            if '/Bios' in path:
-                self._handle_bios_patch(request_handler, vm_name, path)
-            elif '/SecureBoot' in path:
-                self._handle_secure_boot_patch(request_handler, vm_name, path)
-            else:
+            if resource is None:
                 self._handle_system_patch(request_handler, vm_name, path)
+            elif resource in self._patch_routes:
+                self._patch_routes[resource](request_handler, vm_name, path)
+            else:
+                self._send_error_response(request_handler, 404, "Not Found")
         else:
             self._send_error_response(request_handler, 404, "System not found")
     
-    def _extract_vm_name(self, path: str) -> Optional[str]:
-        """Extract VM name from path"""
-        parts = path.split('/')
-        if 'Systems' in parts:
-            systems_index = parts.index('Systems')
-            if len(parts) > systems_index + 1:
-                return parts[systems_index + 1]
-        return None
+    def _prebuild_static_responses(self) -> Dict[str, Tuple[bytes, bytes, str, Optional[bytes]]]:
+        """Pre-serialize the Systems collection and the per-VM sub-resources that never change"""
+        # The VM list is fixed at startup, so the collection is static too
+        prebuilt = {'/redfish/v1/Systems': prebuilt_response(RedfishModels.get_systems_collection(self.vm_configs))}
+        for vm_name in self.vm_configs:
+            for resource in self._doc_builders:
+                data = self._resource_doc(resource, vm_name)
+                prebuilt[f'{SYSTEMS_PREFIX}{vm_name}/{resource}'] = prebuilt_response(data)
+        return prebuilt
     
     def _get_system_info(self, vm_name: str) -> Dict:
         """Get system information for a VM"""
         try:
-            # Get VM power state
-            vmware_client = self.vmware_clients.get(vm_name)
-            if vmware_client:
-                vm_info = vmware_client.get_vm_info(vm_name)
-                power_state = RedfishModels.get_power_state_mapping().get(
-                    vm_info.get('power_state', 'poweredOff'), 'Off'
-                )
-            else:
-                power_state = 'Off'
+            power_state = self._get_power_state(vm_name)
             
-            return {
-                '@odata.type': '#ComputerSystem.v1_13_0.ComputerSystem',
-                '@odata.id': f'/redfish/v1/Systems/{vm_name}',
-                'Id': vm_name,
-                'Name': f'System {vm_name}',
-                'Description': f'VMware VM {vm_name}',
-                'Status': {
-                    'State': 'Enabled',
-                    'Health': 'OK'
-                },
-                'PowerState': power_state,
-                'BiosVersion': '2.0.0',
-                'Manufacturer': 'VMware',
-                'Model': 'Virtual Machine',
-                'SKU': 'VMware VM',
-                'SerialNumber': f'VMware-{vm_name}',
-                'PartNumber': 'VMware-System',
-                'UUID': f'424d4f4e-{vm_name[-8:].ljust(8, "0")}-{vm_name[-4:].ljust(4, "0")}-{vm_name[-4:].ljust(4, "0")}-{vm_name[-12:].ljust(12, "0")}',
-                'HostName': f'{vm_name}.local',
-                'Boot': {
-                    'BootSourceOverrideEnabled': 'Disabled',
-                    'BootSourceOverrideTarget': 'None',
-                    'BootSourceOverrideTarget@Redfish.AllowableValues': [
-                        'None', 'Pxe', 'Cd', 'Usb', 'Hdd', 'BiosSetup'
-                    ]
-                },
-                'Bios': {
-                    '@odata.id': f'/redfish/v1/Systems/{vm_name}/Bios'
-                },
-                'SecureBoot': {
-                    '@odata.id': f'/redfish/v1/Systems/{vm_name}/SecureBoot'
-                },
-                'Storage': {
-                    '@odata.id': f'/redfish/v1/Systems/{vm_name}/Storage'
-                },
-                'Actions': {
-                    '#ComputerSystem.Reset': {
-                        'target': f'/redfish/v1/Systems/{vm_name}/Actions/ComputerSystem.Reset',
-                        'ResetType@Redfish.AllowableValues': [
-                            'On', 'ForceOff', 'GracefulShutdown', 'GracefulRestart', 'ForceRestart'
-                        ]
-                    }
-                },
-                'Links': {
-                    'Chassis': [
-                        {
-                            '@odata.id': f'/redfish/v1/Chassis/{vm_name}-chassis'
-                        }
-                    ],
-                    'ManagedBy': [
-                        {
-                            '@odata.id': f'/redfish/v1/Managers/{vm_name}-bmc'
-                        }
+            tpl = self._system_tpl.get(vm_name)
+            if tpl is None:
+                tpl = self._system_tpl[vm_name] = self._build_system_template(vm_name)
+            return dict(tpl, PowerState=power_state)
+        except Exception as e:
+            logger.error("❌ Error getting system info for %s: %s", vm_name, e)
+            raise
+    
+    def _get_power_state(self, vm_name: str) -> str:
+        """Get the Redfish power state of a VM, reusing a vCenter answer for the VM's power_cache_ttl"""
+        vmware_client = self.vmware_clients.get(vm_name)
+        if not vmware_client:
+            return 'Off'
+        
+        now = time.monotonic()
+        cached = self._power_cache.get(vm_name)
+        if cached is not None and now < cached[0]:
+            return self._cached_power_state(vm_name, cached[1])
+        
+        refresh_lock = self._power_refresh_locks.get(vmware_client)
+        if refresh_lock is None:
+            refresh_lock = self._power_refresh_locks.setdefault(vmware_client, threading.Lock())
+        with refresh_lock:
+            # A refresh that finished while we waited already covers this request
+            cached = self._power_cache.get(vm_name)
+            if cached is not None and now < cached[0]:
+                return self._cached_power_state(vm_name, cached[1])
+            
+            # One miss refreshes every VM behind the same vCenter session in a
+            # single PropertyCollector query, so a fleet of pollers costs one round trip
+            refreshed_at = time.monotonic()
+            vm_names = [name for name, client in self.vmware_clients.items() if client is vmware_client]
+            vm_states = vmware_client.get_vm_power_states(vm_names)
+            
+            # VMs vCenter did not return are remembered briefly as missing, so
+            # polling a deleted VM does not repeat the full-inventory query
+            for name in vm_names:
+                if name in vm_states:
+                    self._power_cache[name] = (
+                        refreshed_at + self._power_cache_ttl.get(name, POWER_STATE_TTL),
+                        translate_power_state(vm_states[name])
+                    )
+                else:
+                    self._power_cache[name] = (refreshed_at + POWER_STATE_MISS_TTL, None)
+            return self._cached_power_state(vm_name, self._power_cache[vm_name][1])
+    
+    @staticmethod
+    def _cached_power_state(vm_name: str, power_state: Optional[str]) -> str:
+        """Return a cached power state, raising LookupError for a VM vCenter did not return"""
+        if power_state is None:
+            raise LookupError(f"Power state for {vm_name} not returned by vCenter")
+        return power_state
+    
+    def _build_system_template(self, vm_name: str) -> Dict:
+        """Build the static part of a ComputerSystem resource"""
+        return {
+            '@odata.type': '#ComputerSystem.v1_13_0.ComputerSystem',
+            '@odata.id': f'/redfish/v1/Systems/{vm_name}',
+            'Id': vm_name,
+            'Name': f'System {vm_name}',
+            'Description': f'VMware VM {vm_name}',
+            'Status': {
+                'State': 'Enabled',
+                'Health': 'OK'
+            },
+            'PowerState': 'Off',
+            'BiosVersion': '2.0.0',
+            'Manufacturer': 'VMware',
+            'Model': 'Virtual Machine',
+            'SKU': 'VMware VM',
+            'SerialNumber': f'VMware-{vm_name}',
+            'PartNumber': 'VMware-System',
+            'UUID': _system_uuid(vm_name),
+            'HostName': f'{vm_name}.local',
+            'Boot': {
+                'BootSourceOverrideEnabled': 'Disabled',
+                'BootSourceOverrideTarget': 'None',
+                'BootSourceOverrideTarget@Redfish.AllowableValues': [
+                    'None', 'Pxe', 'Cd', 'Usb', 'Hdd', 'BiosSetup'
+                ]
+            },
+            'Bios': {
+                '@odata.id': f'/redfish/v1/Systems/{vm_name}/Bios'
+            },
+            'SecureBoot': {
+                '@odata.id': f'/redfish/v1/Systems/{vm_name}/SecureBoot'
+            },
+            'Storage': {
+                '@odata.id': f'/redfish/v1/Systems/{vm_name}/Storage'
+            },
+            'Actions': {
+                '#ComputerSystem.Reset': {
+                    'target': f'/redfish/v1/Systems/{vm_name}/Actions/ComputerSystem.Reset',
+                    'ResetType@Redfish.AllowableValues': [
+                        'On', 'ForceOff', 'GracefulShutdown', 'GracefulRestart', 'ForceRestart'
                     ]
                 }
+            },
+            'Links': {
+                'Chassis': [
+                    {
+                        '@odata.id': f'/redfish/v1/Chassis/{vm_name}-chassis'
+                    }
+                ],
+                'ManagedBy': [
+                    {
+                        '@odata.id': f'/redfish/v1/Managers/{vm_name}-bmc'
+                    }
+                ]
             }
-        except Exception as e:
-            logger.error(f"❌ Error getting system info for {vm_name}: {e}")
-            raise
+        }
+    
+    def _resource_doc(self, resource: str, vm_name: str) -> Dict:
+        """Return the cached static document for a VM sub-resource, building it once"""
+        key = (resource, vm_name)
+        doc = self._resource_docs.get(key)
+        if doc is None:
+            doc = self._resource_docs[key] = self._doc_builders[resource](vm_name)
+        return doc
     
     def _handle_bios_get(self, request_handler, vm_name: str, path: str):
         """Handle BIOS GET requests"""
         if path.endswith('/Bios'):
-            data = {
-                '@odata.type': '#Bios.v1_1_0.Bios',
-                '@odata.id': f'/redfish/v1/Systems/{vm_name}/Bios',
-                'Id': 'BIOS',
-                'Name': 'BIOS Configuration',
-                'Description': f'BIOS Configuration for {vm_name}',
-                'BiosVersion': '2.0.0',
-                'Attributes': {
-                    'SecureBootEnable': True,
-                    'TpmSecurity': 'On',
-                    'BootMode': 'UEFI'
-                },
-                'Actions': {
-                    '#Bios.ResetBios': {
-                        'target': f'/redfish/v1/Systems/{vm_name}/Bios/Actions/Bios.ResetBios'
-                    },
-                    '#Bios.ChangePassword': {
-                        'target': f'/redfish/v1/Systems/{vm_name}/Bios/Actions/Bios.ChangePassword'
-                    }
-                }
-            }
-            self._send_json_response(request_handler, 200, data)
+            self._send_json_response(request_handler, 200, self._resource_doc('Bios', vm_name))
         else:
             self._send_error_response(request_handler, 404, "Not Found")
     
     def _handle_storage_get(self, request_handler, vm_name: str, path: str):
         """Handle Storage GET requests"""
-        if path.endswith('/Storage'):
+        storage_id = path.rpartition('/')[2]
+        if storage_id == 'Storage':
             # Storage collection
-            data = {
-                '@odata.type': '#StorageCollection.StorageCollection',
-                '@odata.id': f'/redfish/v1/Systems/{vm_name}/Storage',
-                'Name': 'Storage Collection',
-                'Description': f'Storage Collection for {vm_name}',
-                'Members@odata.count': 1,
-                'Members': [
-                    {
-                        '@odata.id': f'/redfish/v1/Systems/{vm_name}/Storage/1'
-                    }
-                ]
-            }
-            self._send_json_response(request_handler, 200, data)
-        elif '/Storage/' in path and path.split('/')[-1].isdigit():
+            self._send_json_response(request_handler, 200, self._resource_doc('Storage', vm_name))
+        elif storage_id.isdigit() and path.startswith(f'{SYSTEMS_PREFIX}{vm_name}/Storage/'):
             # Individual storage controller
-            storage_id = path.split('/')[-1]
             data = {
                 '@odata.type': '#Storage.v1_8_0.Storage',
                 '@odata.id': f'/redfish/v1/Systems/{vm_name}/Storage/{storage_id}',
@@ -233,43 +336,100 @@ class SystemsHandler:
     def _handle_secure_boot_get(self, request_handler, vm_name: str, path: str):
         """Handle SecureBoot GET requests"""
         if path.endswith('/SecureBoot'):
-            data = {
-                '@odata.type': '#SecureBoot.v1_1_0.SecureBoot',
-                '@odata.id': f'/redfish/v1/Systems/{vm_name}/SecureBoot',
-                'Id': 'SecureBoot',
-                'Name': 'Secure Boot',
-                'Description': f'Secure Boot for {vm_name}',
+            self._send_json_response(request_handler, 200, self._resource_doc('SecureBoot', vm_name))
+        else:
+            self._send_error_response(request_handler, 404, "Not Found")
+    
+    def _build_bios(self, vm_name: str) -> Dict:
+        """Build the BIOS resource for a VM"""
+        return {
+            '@odata.type': '#Bios.v1_1_0.Bios',
+            '@odata.id': f'/redfish/v1/Systems/{vm_name}/Bios',
+            'Id': 'BIOS',
+            'Name': 'BIOS Configuration',
+            'Description': f'BIOS Configuration for {vm_name}',
+            'BiosVersion': '2.0.0',
+            'Attributes': {
                 'SecureBootEnable': True,
-                'SecureBootCurrentBoot': 'Enabled',
-                'SecureBootMode': 'UserMode',
-                'Actions': {
-                    '#SecureBoot.ResetKeys': {
-                        'target': f'/redfish/v1/Systems/{vm_name}/SecureBoot/Actions/SecureBoot.ResetKeys'
-                    }
+                'TpmSecurity': 'On',
+                'BootMode': 'UEFI'
+            },
+            'Actions': {
+                '#Bios.ResetBios': {
+                    'target': f'/redfish/v1/Systems/{vm_name}/Bios/Actions/Bios.ResetBios'
+                },
+                '#Bios.ChangePassword': {
+                    'target': f'/redfish/v1/Systems/{vm_name}/Bios/Actions/Bios.ChangePassword'
                 }
             }
-            self._send_json_response(request_handler, 200, data)
-        else:
-            self._send_error_response(request_handler, 404, "Not Found")
+        }
     
-    def _handle_system_action(self, request_handler, vm_name: str, path: str):
-        """Handle system actions like power operations"""
+    def _build_storage_collection(self, vm_name: str) -> Dict:
+        """Build the Storage collection for a VM"""
+        return {
+            '@odata.type': '#StorageCollection.StorageCollection',
+            '@odata.id': f'/redfish/v1/Systems/{vm_name}/Storage',
+            'Name': 'Storage Collection',
+            'Description': f'Storage Collection for {vm_name}',
+            'Members@odata.count': 1,
+            'Members': [
+                {
+                    '@odata.id': f'/redfish/v1/Systems/{vm_name}/Storage/1'
+                }
+            ]
+        }
+    
+    def _build_secure_boot(self, vm_name: str) -> Dict:
+        """Build the SecureBoot resource for a VM"""
+        return {
+            '@odata.type': '#SecureBoot.v1_1_0.SecureBoot',
+            '@odata.id': f'/redfish/v1/Systems/{vm_name}/SecureBoot',
+            'Id': 'SecureBoot',
+            'Name': 'Secure Boot',
+            'Description': f'Secure Boot for {vm_name}',
+            'SecureBootEnable': True,
+            'SecureBootCurrentBoot': 'Enabled',
+            'SecureBootMode': 'UserMode',
+            'Actions': {
+                '#SecureBoot.ResetKeys': {
+                    'target': f'/redfish/v1/Systems/{vm_name}/SecureBoot/Actions/SecureBoot.ResetKeys'
+                }
+            }
+        }
+    
+    def _read_json_body(self, request_handler, missing_message: str) -> Tuple[Optional[Dict], Optional[Tuple[int, str]]]:
+        """Read and parse a JSON object body, returning (data, None) or (None, (status, message))"""
         try:
             content_length = int(request_handler.headers.get('Content-Length', 0))
-            if content_length > 0:
-                post_data = request_handler.rfile.read(content_length)
-                data = json.loads(post_data.decode('utf-8'))
-                
-                if 'ComputerSystem.Reset' in path:
-                    reset_type = data.get('ResetType', 'On')
-                    self._handle_power_action(request_handler, vm_name, reset_type)
-                else:
-                    self._send_error_response(request_handler, 400, "Unsupported action")
-            else:
-                self._send_error_response(request_handler, 400, "Missing action data")
-        except Exception as e:
-            logger.error(f"❌ Error handling system action for {vm_name}: {e}")
-            self._send_error_response(request_handler, 500, "Internal Server Error")
+        except ValueError:
+            return None, (400, "Invalid Content-Length")
+        if content_length <= 0:
+            return None, (400, missing_message)
+        
+        try:
+            body = request_handler.rfile.read(content_length)
+        except OSError as e:
+            logger.error("❌ Failed to read request body: %s", e)
+            return None, (500, "Internal Server Error")
+        
+        try:
+            data = loads(body)
+        except ValueError:
+            return None, (400, "Malformed JSON in request body")
+        if not isinstance(data, dict):
+            return None, (400, "Request body must be a JSON object")
+        return data, None
+    
+    def _handle_system_action(self, request_handler, vm_name: str, path: str):
+        """Handle system actions like power operations"""
+        data, error = self._read_json_body(request_handler, "Missing action data")
+        if error:
+            self._send_error_response(request_handler, *error)
+        elif 'ComputerSystem.Reset' in path:
+            reset_type = data.get('ResetType', 'On')
+            self._handle_power_action(request_handler, vm_name, reset_type)
+        else:
+            self._send_error_response(request_handler, 400, "Unsupported action")
     
     def _handle_power_action(self, request_handler, vm_name: str, reset_type: str):
         """Handle power management actions"""
@@ -279,7 +439,12 @@ class SystemsHandler:
                 self._send_error_response(request_handler, 503, "VMware client not available")
                 return
             
-            logger.info(f"🔌 Power action for {vm_name}: {reset_type}")
+            method_name = self._RESET_DISPATCH.get(reset_type)
+            if method_name is None:
+                self._send_error_response(request_handler, 400, "Unsupported ResetType")
+                return
+            
+            logger.info("🔌 Power action for %s: %s", vm_name, reset_type)
             
             # Create task for the operation
             task_id = self.task_manager.create_task(
@@ -289,17 +454,11 @@ class SystemsHandler:
             )
             
             # Perform the power operation
-            success = False
-            if reset_type == 'On':
-                success = vmware_client.power_on_vm(vm_name)
-            elif reset_type == 'ForceOff':
-                success = vmware_client.power_off_vm(vm_name)
-            elif reset_type == 'GracefulShutdown':
-                success = vmware_client.shutdown_vm(vm_name)
-            elif reset_type == 'GracefulRestart':
-                success = vmware_client.restart_vm(vm_name)
-            elif reset_type == 'ForceRestart':
-                success = vmware_client.reset_vm(vm_name)
+            try:
+                success = getattr(vmware_client, method_name)(vm_name)
+            finally:
+                # The VM is changing state, so the next read must go to vCenter
+                self._power_cache.pop(vm_name, None)
             
             # Update task based on result
             if success:
@@ -311,110 +470,61 @@ class SystemsHandler:
                 self._send_error_response(request_handler, 500, "Power operation failed")
                 
         except Exception as e:
-            logger.error(f"❌ Power action error for {vm_name}: {e}")
+            logger.error("❌ Power action error for %s: %s", vm_name, e)
             self._send_error_response(request_handler, 500, "Internal Server Error")
     
     def _handle_system_patch(self, request_handler, vm_name: str, path: str):
         """Handle system PATCH requests"""
-        try:
-            content_length = int(request_handler.headers.get('Content-Length', 0))
-            if content_length > 0:
-                patch_data = request_handler.rfile.read(content_length)
-                data = json.loads(patch_data.decode('utf-8'))
-                
-                # Handle boot configuration changes
-                if 'Boot' in data:
-                    boot_config = data['Boot']
-                    logger.info(f"🥾 Boot configuration change for {vm_name}: {boot_config}")
-                    
-                    # For now, just acknowledge the change
-                    request_handler.send_response(200)
-                    request_handler.send_header('Content-Type', 'application/json')
-                    request_handler.end_headers()
-                    
-                    response = {
-                        '@odata.type': '#ComputerSystem.v1_13_0.ComputerSystem',
-                        'Id': vm_name,
-                        'Boot': boot_config
-                    }
-                    request_handler.wfile.write(json.dumps(response).encode('utf-8'))
-                else:
-                    self._send_error_response(request_handler, 400, "No supported properties to patch")
-            else:
-                self._send_error_response(request_handler, 400, "Missing patch data")
-        except Exception as e:
-            logger.error(f"❌ System PATCH error for {vm_name}: {e}")
-            self._send_error_response(request_handler, 500, "Internal Server Error")
+        data, error = self._read_json_body(request_handler, "Missing patch data")
+        if error:
+            self._send_error_response(request_handler, *error)
+            return
+        
+        # Handle boot configuration changes
+        if 'Boot' in data:
+            boot_config = data['Boot']
+            logger.info("🥾 Boot configuration change for %s: %s", vm_name, boot_config)
+            
+            # For now, just acknowledge the change
+            response = {
+                '@odata.type': '#ComputerSystem.v1_13_0.ComputerSystem',
+                'Id': vm_name,
+                'Boot': boot_config
+            }
+            self._send_json_response(request_handler, 200, response)
+        else:
+            self._send_error_response(request_handler, 400, "No supported properties to patch")
     
     def _handle_bios_patch(self, request_handler, vm_name: str, path: str):
         """Handle BIOS PATCH requests"""
-        try:
-            content_length = int(request_handler.headers.get('Content-Length', 0))
-            if content_length > 0:
-                patch_data = request_handler.rfile.read(content_length)
-                data = json.loads(patch_data.decode('utf-8'))
-                
-                logger.info(f"🔧 BIOS configuration change for {vm_name}: {data}")
-                
-                # For now, just acknowledge the change
-                request_handler.send_response(200)
-                request_handler.send_header('Content-Type', 'application/json')
-                request_handler.end_headers()
-                
-                response = {
-                    '@odata.type': '#Bios.v1_1_0.Bios',
-                    'Id': 'BIOS',
-                    'Attributes': data.get('Attributes', {})
-                }
-                request_handler.wfile.write(json.dumps(response).encode('utf-8'))
-            else:
-                self._send_error_response(request_handler, 400, "Missing patch data")
-        except Exception as e:
-            logger.error(f"❌ BIOS PATCH error for {vm_name}: {e}")
-            self._send_error_response(request_handler, 500, "Internal Server Error")
+        data, error = self._read_json_body(request_handler, "Missing patch data")
+        if error:
+            self._send_error_response(request_handler, *error)
+            return
+        
+        logger.info("🔧 BIOS configuration change for %s: %s", vm_name, data)
+        
+        # For now, just acknowledge the change
+        response = {
+            '@odata.type': '#Bios.v1_1_0.Bios',
+            'Id': 'BIOS',
+            'Attributes': data.get('Attributes', {})
+        }
+        self._send_json_response(request_handler, 200, response)
     
     def _handle_secure_boot_patch(self, request_handler, vm_name: str, path: str):
         """Handle SecureBoot PATCH requests"""
-        try:
-            content_length = int(request_handler.headers.get('Content-Length', 0))
-            if content_length > 0:
-                patch_data = request_handler.rfile.read(content_length)
-                data = json.loads(patch_data.decode('utf-8'))
-                
-                logger.info(f"🔒 SecureBoot configuration change for {vm_name}: {data}")
-                
-                # For now, just acknowledge the change
-                request_handler.send_response(200)
-                request_handler.send_header('Content-Type', 'application/json')
-                request_handler.end_headers()
-                
-                response = {
-                    '@odata.type': '#SecureBoot.v1_1_0.SecureBoot',
-                    'Id': 'SecureBoot',
-                    'SecureBootEnable': data.get('SecureBootEnable', True)
-                }
-                request_handler.wfile.write(json.dumps(response).encode('utf-8'))
-            else:
-                self._send_error_response(request_handler, 400, "Missing patch data")
-        except Exception as e:
-            logger.error(f"❌ SecureBoot PATCH error for {vm_name}: {e}")
-            self._send_error_response(request_handler, 500, "Internal Server Error")
-    
-    def _send_json_response(self, request_handler, status_code: int, data: Dict):
-        """Send JSON response"""
-        json_data = json.dumps(data, indent=2)
-        request_handler.send_response(status_code)
-        request_handler.send_header('Content-Type', 'application/json')
-        request_handler.send_header('Content-Length', str(len(json_data)))
-        request_handler.end_headers()
-        request_handler.wfile.write(json_data.encode('utf-8'))
-    
-    def _send_error_response(self, request_handler, status_code: int, message: str):
-        """Send error response"""
-        error_data = {
-            "error": {
-                "code": f"Base.1.0.{status_code}",
-                "message": message
-            }
+        data, error = self._read_json_body(request_handler, "Missing patch data")
+        if error:
+            self._send_error_response(request_handler, *error)
+            return
+        
+        logger.info("🔒 SecureBoot configuration change for %s: %s", vm_name, data)
+        
+        # For now, just acknowledge the change
+        response = {
+            '@odata.type': '#SecureBoot.v1_1_0.SecureBoot',
+            'Id': 'SecureBoot',
+            'SecureBootEnable': data.get('SecureBootEnable', True)
         }
-        self._send_json_response(request_handler, status_code, error_data)
+        self._send_json_response(request_handler, 200, response)
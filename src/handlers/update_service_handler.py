@@ -4,47 +4,45 @@ Update Service Handler
 Handles Redfish UpdateService endpoints for firmware/software management.
 """
 
-import json
 import logging
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from models.redfish_schemas import RedfishModels
+from utils.serialization import dumps
+from .json_response import JsonResponseMixin, prebuilt_body, prebuilt_response
 
 logger = logging.getLogger(__name__)
 
 
-class UpdateServiceHandler:
+class UpdateServiceHandler(JsonResponseMixin):
     """Handler for Redfish UpdateService endpoints"""
     
     def __init__(self, vm_configs: Dict, vmware_clients: Dict, task_manager):
         self.vm_configs = vm_configs
         self.vmware_clients = vmware_clients
         self.task_manager = task_manager
+        self._static_responses = self._prebuild_static_responses()
         logger.info("🔄 UpdateService handler initialized")
     
     def handle_get(self, request_handler, path: str):
         """Handle GET requests for UpdateService"""
-        logger.warning(f"🔄 CRITICAL UpdateService GET: {path}")
+        logger.warning("🔄 CRITICAL UpdateService GET: %s", path)
         
-        if path == '/redfish/v1/UpdateService':
-            # UpdateService root
-            data = RedfishModels.get_update_service()
-            self._send_json_response(request_handler, 200, data)
-        elif path == '/redfish/v1/UpdateService/FirmwareInventory':
-            # FirmwareInventory collection
-            data = RedfishModels.get_firmware_inventory()
-            self._send_json_response(request_handler, 200, data)
-        elif path == '/redfish/v1/UpdateService/FirmwareInventory/BIOS':
-            # BIOS firmware component
-            data = RedfishModels.get_bios_firmware()
-            self._send_json_response(request_handler, 200, data)
-        elif path == '/redfish/v1/UpdateService/SoftwareInventory':
-            # SoftwareInventory collection
-            data = self._get_software_inventory()
-            self._send_json_response(request_handler, 200, data)
+        prebuilt = self._static_responses.get(path)
+        if prebuilt is not None:
+            self._send_json_bytes(request_handler, 200, *prebuilt)
         else:
             self._send_error_response(request_handler, 404, "Not Found")
     
+    def _prebuild_static_responses(self) -> Dict[str, Tuple[bytes, bytes, str, Optional[bytes]]]:
+        """Pre-serialize every UpdateService resource; none of them change at runtime"""
+        return {
+            '/redfish/v1/UpdateService': prebuilt_body(RedfishModels.get_update_service_bytes()),
+            '/redfish/v1/UpdateService/FirmwareInventory': prebuilt_body(RedfishModels.get_firmware_inventory_bytes()),
+            '/redfish/v1/UpdateService/FirmwareInventory/BIOS': prebuilt_body(RedfishModels.get_bios_firmware_bytes()),
+            '/redfish/v1/UpdateService/SoftwareInventory': prebuilt_response(self._get_software_inventory())
+        }
+    
     def _get_software_inventory(self) -> Dict:
         """Get software inventory collection"""
         return {
@@ -101,24 +99,14 @@ class UpdateServiceHandler:
     
     def _send_json_response(self, request_handler, status_code: int, data: Dict):
         """Send JSON response"""
-        json_data = json.dumps(data, indent=2)
-        
-        # Special logging for UpdateService responses
-        logger.warning(f"🔄 UpdateService Response {status_code}: {len(json_data)} bytes")
-        logger.debug(f"🔄 UpdateService Response Data: {json_data[:200]}...")
-        
-        request_handler.send_response(status_code)
-        request_handler.send_header('Content-Type', 'application/json')
-        request_handler.send_header('Content-Length', str(len(json_data)))
-        request_handler.end_headers()
-        request_handler.wfile.write(json_data.encode('utf-8'))
+        body = dumps(data)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔄 UpdateService Response Data: %s...", body[:200].decode('utf-8', errors='replace'))
+        self._send_json_bytes(request_handler, status_code, body)
     
-    def _send_error_response(self, request_handler, status_code: int, message: str):
-        """Send error response"""
-        error_data = {
-            "error": {
-                "code": f"Base.1.0.{status_code}",
-                "message": message
-            }
-        }
-        self._send_json_response(request_handler, status_code, error_data)
+    def _send_json_bytes(self, request_handler, status_code: int, body: bytes,
+                         length_line: Optional[bytes] = None, etag: Optional[str] = None,
+                         gzipped_body: Optional[bytes] = None):
+        """Send an already serialized JSON response"""
+        logger.warning("🔄 UpdateService Response %s: %d bytes", status_code, len(body))
+        super()._send_json_bytes(request_handler, status_code, body, length_line, etag, gzipped_body)
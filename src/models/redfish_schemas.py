@@ -4,63 +4,176 @@ Redfish Data Models
 Contains data structures and schemas for Redfish responses.
 """
 
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Collection, Dict, Mapping, Optional
+
+from utils.serialization import dumps
+
+# Member @odata.id prefixes of the VM collections
+SYSTEMS_PREFIX = '/redfish/v1/Systems/'
+MANAGERS_PREFIX = '/redfish/v1/Managers/'
+CHASSIS_PREFIX = '/redfish/v1/Chassis/'
+
+
+def _freeze(document):
+    """Return a read-only copy of a JSON document: dicts become MappingProxyType, lists tuples"""
+    if isinstance(document, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in document.items()})
+    if isinstance(document, list):
+        return tuple(_freeze(item) for item in document)
+    return document
+
+
+# Constant documents, built once at import and frozen, so the getters can hand
+# the same object to every caller
+_SERVICE_ROOT: Mapping = _freeze({
+    '@odata.type': '#ServiceRoot.v1_5_0.ServiceRoot',
+    '@odata.id': '/redfish/v1/',
+    'Id': 'RootService',
+    'Name': 'Redfish VMware Server',
+    'RedfishVersion': '1.8.0',
+    'UUID': 'c14d91c0-8c5f-4f9b-9b1f-9c5f8f9b1f9c',
+    'Description': 'VMware Redfish Server for Metal3/Ironic compatibility',
+    'Product': 'VMware Redfish Bridge',
+    'ProtocolFeaturesSupported': {
+        'ExcerptQuery': False,
+        'ExpandQuery': {
+            'ExpandAll': True,
+            'Levels': True,
+            'MaxLevels': 6,
+            'NoLinks': True
+        },
+        'FilterQuery': True,
+        'OnlyMemberQuery': True,
+        'SelectQuery': True
+    },
+    'Systems': {
+        '@odata.id': '/redfish/v1/Systems'
+    },
+    'Chassis': {
+        '@odata.id': '/redfish/v1/Chassis'
+    },
+    'Managers': {
+        '@odata.id': '/redfish/v1/Managers'
+    },
+    'SessionService': {
+        '@odata.id': '/redfish/v1/SessionService'
+    },
+    'TaskService': {
+        '@odata.id': '/redfish/v1/TaskService'
+    },
+    'UpdateService': {
+        '@odata.id': '/redfish/v1/UpdateService'
+    },
+    'Links': {
+        'Sessions': {
+            '@odata.id': '/redfish/v1/SessionService/Sessions'
+        }
+    }
+})
+
+_SESSION_SERVICE: Mapping = _freeze({
+    '@odata.type': '#SessionService.v1_1_7.SessionService',
+    '@odata.id': '/redfish/v1/SessionService',
+    'Id': 'SessionService',
+    'Name': 'Session Service',
+    'Description': 'Session Service for Redfish VMware Server',
+    'Status': {
+        'State': 'Enabled',
+        'Health': 'OK'
+    },
+    'ServiceEnabled': True,
+    'SessionTimeout': 600,
+    'Sessions': {
+        '@odata.id': '/redfish/v1/SessionService/Sessions'
+    }
+})
+
+_UPDATE_SERVICE: Mapping = _freeze({
+    '@odata.type': '#UpdateService.v1_5_0.UpdateService',
+    '@odata.id': '/redfish/v1/UpdateService',
+    'Id': 'UpdateService',
+    'Name': 'Update Service',
+    'Description': 'Service for updating firmware and software',
+    'Status': {
+        'State': 'Enabled',
+        'Health': 'OK'
+    },
+    'ServiceEnabled': True,
+    'FirmwareInventory': {
+        '@odata.id': '/redfish/v1/UpdateService/FirmwareInventory'
+    },
+    'SoftwareInventory': {
+        '@odata.id': '/redfish/v1/UpdateService/SoftwareInventory'
+    }
+})
+
+_FIRMWARE_INVENTORY: Mapping = _freeze({
+    '@odata.type': '#SoftwareInventoryCollection.SoftwareInventoryCollection',
+    '@odata.id': '/redfish/v1/UpdateService/FirmwareInventory',
+    'Name': 'Firmware Inventory Collection',
+    'Description': 'Collection of Firmware Components',
+    'Members@odata.count': 1,
+    'Members': [
+        {
+            '@odata.id': '/redfish/v1/UpdateService/FirmwareInventory/BIOS'
+        }
+    ]
+})
+
+_BIOS_FIRMWARE: Mapping = _freeze({
+    '@odata.type': '#SoftwareInventory.v1_1_0.SoftwareInventory',
+    '@odata.id': '/redfish/v1/UpdateService/FirmwareInventory/BIOS',
+    'Id': 'BIOS',
+    'Name': 'System BIOS',
+    'Description': 'System BIOS Firmware',
+    'Status': {
+        'State': 'Enabled',
+        'Health': 'OK'
+    },
+    'SoftwareId': 'BIOS',
+    'Version': '2.0.0',
+    'Updateable': True,
+    'ReleaseDate': '2024-01-01T00:00:00Z'
+})
+
+_POWER_STATE_MAP: Mapping[str, str] = _freeze({
+    'poweredOn': 'On',
+    'poweredOff': 'Off',
+    'suspended': 'PoweringOn'  # Treat suspended as transitional state
+})
+
+# Compact JSON encodings of the constant documents, for handlers that write
+# them straight to the socket
+_SERVICE_ROOT_BYTES = dumps(_SERVICE_ROOT)
+_SESSION_SERVICE_BYTES = dumps(_SESSION_SERVICE)
+_UPDATE_SERVICE_BYTES = dumps(_UPDATE_SERVICE)
+_FIRMWARE_INVENTORY_BYTES = dumps(_FIRMWARE_INVENTORY)
+_BIOS_FIRMWARE_BYTES = dumps(_BIOS_FIRMWARE)
+
+
+def translate_power_state(vmware_state: str) -> str:
+    """Map a vSphere runtime.powerState to the Redfish PowerState, reporting anything unknown as Off"""
+    return _POWER_STATE_MAP.get(vmware_state, 'Off')
 
 
 class RedfishModels:
     """Static methods for generating Redfish compliant responses"""
     
     @staticmethod
-    def get_service_root() -> Dict:
+    def get_service_root() -> Mapping:
         """Get Redfish service root"""
-        return {
-            '@odata.type': '#ServiceRoot.v1_5_0.ServiceRoot',
-            '@odata.id': '/redfish/v1/',
-            'Id': 'RootService',
-            'Name': 'Redfish VMware Server',
-            'RedfishVersion': '1.8.0',
-            'UUID': 'c14d91c0-8c5f-4f9b-9b1f-9c5f8f9b1f9c',
-            'Description': 'VMware Redfish Server for Metal3/Ironic compatibility',
-            'Product': 'VMware Redfish Bridge',
-            'ProtocolFeaturesSupported': {
-                'ExcerptQuery': False,
-                'ExpandQuery': {
-                    'ExpandAll': True,
-                    'Levels': True,
-                    'MaxLevels': 6,
-                    'NoLinks': True
-                },
-                'FilterQuery': True,
-                'OnlyMemberQuery': True,
-                'SelectQuery': True
-            },
-            'Systems': {
-                '@odata.id': '/redfish/v1/Systems'
-            },
-            'Chassis': {
-                '@odata.id': '/redfish/v1/Chassis'
-            },
-            'Managers': {
-                '@odata.id': '/redfish/v1/Managers'
-            },
-            'SessionService': {
-                '@odata.id': '/redfish/v1/SessionService'
-            },
-            'TaskService': {
-                '@odata.id': '/redfish/v1/TaskService'
-            },
-            'UpdateService': {
-                '@odata.id': '/redfish/v1/UpdateService'
-            },
-            'Links': {
-                'Sessions': {
-                    '@odata.id': '/redfish/v1/SessionService/Sessions'
-                }
-            }
-        }
+        return _SERVICE_ROOT
+    
+    @staticmethod
+    def get_service_root_bytes() -> bytes:
+        """Get the service root as compact JSON bytes"""
+        return _SERVICE_ROOT_BYTES
     
+    # The VM collections are built once, when the resource handlers pre-serialize
+    # their static responses at startup, so they are not cached here
     @staticmethod
-    def get_systems_collection(vm_names: List[str]) -> Dict:
+    def get_systems_collection(vm_names: Collection[str]) -> Dict:
         """Get Systems collection"""
         return {
             '@odata.type': '#ComputerSystemCollection.ComputerSystemCollection',
@@ -68,16 +181,11 @@ class RedfishModels:
             'Name': 'Computer System Collection',
             'Description': 'Collection of Computer Systems',
             'Members@odata.count': len(vm_names),
-            'Members': [
-                {
-                    '@odata.id': f'/redfish/v1/Systems/{vm_name}'
-                }
-                for vm_name in vm_names
-            ]
+            'Members': [{'@odata.id': SYSTEMS_PREFIX + vm_name} for vm_name in vm_names]
         }
     
     @staticmethod
-    def get_managers_collection(vm_names: List[str]) -> Dict:
+    def get_managers_collection(vm_names: Collection[str]) -> Dict:
         """Get Managers collection"""
         return {
             '@odata.type': '#ManagerCollection.ManagerCollection',
@@ -85,16 +193,11 @@ class RedfishModels:
             'Name': 'Manager Collection',
             'Description': 'Collection of Managers',
             'Members@odata.count': len(vm_names),
-            'Members': [
-                {
-                    '@odata.id': f'/redfish/v1/Managers/{vm_name}-bmc'
-                }
-                for vm_name in vm_names
-            ]
+            'Members': [{'@odata.id': MANAGERS_PREFIX + vm_name + '-bmc'} for vm_name in vm_names]
         }
     
     @staticmethod
-    def get_chassis_collection(vm_names: List[str]) -> Dict:
+    def get_chassis_collection(vm_names: Collection[str]) -> Dict:
         """Get Chassis collection"""
         return {
             '@odata.type': '#ChassisCollection.ChassisCollection',
@@ -102,96 +205,50 @@ class RedfishModels:
             'Name': 'Chassis Collection',
             'Description': 'Collection of Chassis',
             'Members@odata.count': len(vm_names),
-            'Members': [
-                {
-                    '@odata.id': f'/redfish/v1/Chassis/{vm_name}-chassis'
-                }
-                for vm_name in vm_names
-            ]
+            'Members': [{'@odata.id': CHASSIS_PREFIX + vm_name + '-chassis'} for vm_name in vm_names]
         }
     
     @staticmethod
-    def get_session_service() -> Dict:
+    def get_session_service() -> Mapping:
         """Get SessionService information"""
-        return {
-            '@odata.type': '#SessionService.v1_1_7.SessionService',
-            '@odata.id': '/redfish/v1/SessionService',
-            'Id': 'SessionService',
-            'Name': 'Session Service',
-            'Description': 'Session Service for Redfish VMware Server',
-            'Status': {
-                'State': 'Enabled',
-                'Health': 'OK'
-            },
-            'ServiceEnabled': True,
-            'SessionTimeout': 600,
-            'Sessions': {
-                '@odata.id': '/redfish/v1/SessionService/Sessions'
-            }
-        }
+        return _SESSION_SERVICE
+    
+    @staticmethod
+    def get_session_service_bytes() -> bytes:
+        """Get the SessionService as compact JSON bytes"""
+        return _SESSION_SERVICE_BYTES
     
     @staticmethod
-    def get_update_service() -> Dict:
+    def get_update_service() -> Mapping:
         """Get UpdateService for Metal3/Ironic compatibility"""
-        return {
-            '@odata.type': '#UpdateService.v1_5_0.UpdateService',
-            '@odata.id': '/redfish/v1/UpdateService',
-            'Id': 'UpdateService',
-            'Name': 'Update Service',
-            'Description': 'Service for updating firmware and software',
-            'Status': {
-                'State': 'Enabled',
-                'Health': 'OK'
-            },
-            'ServiceEnabled': True,
-            'FirmwareInventory': {
-                '@odata.id': '/redfish/v1/UpdateService/FirmwareInventory'
-            },
-            'SoftwareInventory': {
-                '@odata.id': '/redfish/v1/UpdateService/SoftwareInventory'
-            }
-        }
+        return _UPDATE_SERVICE
     
     @staticmethod
-    def get_firmware_inventory() -> Dict:
+    def get_update_service_bytes() -> bytes:
+        """Get the UpdateService as compact JSON bytes"""
+        return _UPDATE_SERVICE_BYTES
+    
+    @staticmethod
+    def get_firmware_inventory() -> Mapping:
         """Get FirmwareInventory collection for Metal3/Ironic"""
-        return {
-            '@odata.type': '#SoftwareInventoryCollection.SoftwareInventoryCollection',
-            '@odata.id': '/redfish/v1/UpdateService/FirmwareInventory',
-            'Name': 'Firmware Inventory Collection',
-            'Description': 'Collection of Firmware Components',
-            'Members@odata.count': 1,
-            'Members': [
-                {
-                    '@odata.id': '/redfish/v1/UpdateService/FirmwareInventory/BIOS'
-                }
-            ]
-        }
+        return _FIRMWARE_INVENTORY
+    
+    @staticmethod
+    def get_firmware_inventory_bytes() -> bytes:
+        """Get the FirmwareInventory collection as compact JSON bytes"""
+        return _FIRMWARE_INVENTORY_BYTES
     
     @staticmethod
-    def get_bios_firmware() -> Dict:
+    def get_bios_firmware() -> Mapping:
         """Get BIOS firmware component for Metal3/Ironic"""
-        return {
-            '@odata.type': '#SoftwareInventory.v1_1_0.SoftwareInventory',
-            '@odata.id': '/redfish/v1/UpdateService/FirmwareInventory/BIOS',
-            'Id': 'BIOS',
-            'Name': 'System BIOS',
-            'Description': 'System BIOS Firmware',
-            'Status': {
-                'State': 'Enabled',
-                'Health': 'OK'
-            },
-            'SoftwareId': 'BIOS',
-            'Version': '2.0.0',
-            'Updateable': True,
-            'ReleaseDate': '2024-01-01T00:00:00Z'
-        }
+        return _BIOS_FIRMWARE
     
     @staticmethod
-    def get_power_state_mapping() -> Dict[str, str]:
+    def get_bios_firmware_bytes() -> bytes:
+        """Get the BIOS firmware component as compact JSON bytes"""
+        return _BIOS_FIRMWARE_BYTES
+    
+    @staticmethod
+    def get_power_state_mapping() -> Mapping[str, str]:
         """Get VMware to Redfish power state mapping"""
-        return {
-            'poweredOn': 'On',
-            'poweredOff': 'Off',
-            'suspended': 'PoweringOn'  # Treat suspended as transitional state
-        }
+        return _POWER_STATE_MAP
@@ -7,23 +7,35 @@ with enhanced debugging, performance monitoring, and comprehensive logging.
 Converts Redfish operations to VMware vSphere API calls with detailed tracking.
 """
 
-import json
+import errno
 import logging
 import os
+import selectors
+import signal
 import ssl
+import socket
 import socketserver
 import sys
 import threading
 import time
 from http.server import HTTPServer
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 from utils.logging_config import setup_logging, log_performance_metric, create_debug_context
+from utils.serialization import JSONDecodeError, loads
 from handlers.http_handler import RedfishRequestHandler, get_request_statistics
 from handlers.redfish_handler import RedfishHandler
 
 # Setup enhanced logging first
 logger = setup_logging()
 
+# Seconds between periodic health reports
+HEALTH_REPORT_INTERVAL = 300
+
 
 class ServerHealthMonitor:
     """Monitor server health and performance metrics"""
@@ -90,24 +102,121 @@ class ServerHealthMonitor:
         return f"{int(hours)}h {int(minutes)}m {int(seconds)}s"
 
 
+def _describe_port_owner(port):
+    """Name the process listening on a TCP port, or None when it cannot be determined"""
+    if psutil is None:
+        return None
+    try:
+        for conn in psutil.net_connections(kind='tcp'):
+            if conn.laddr and conn.laddr.port == port and conn.status == psutil.CONN_LISTEN:
+                if conn.pid is None:
+                    return "another process"
+                try:
+                    return f"pid {conn.pid} ({psutil.Process(conn.pid).name()})"
+                except psutil.Error:
+                    return f"pid {conn.pid}"
+    except (psutil.Error, OSError):
+        pass
+    return None
+
+
 # Global health monitor
 health_monitor = ServerHealthMonitor()
 
 
-class RedfishHTTPServer(HTTPServer):
-    """Enhanced HTTP server with Redfish handler and health monitoring"""
+class RedfishHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
+    """Enhanced HTTP server with Redfish handler and health monitoring
     
-    def __init__(self, server_address, RequestHandlerClass, handler):
+    Each connection is served on its own daemon thread so a slow vCenter call
+    or an idle keep-alive client does not stall the other Ironic pollers.
+    """
+    
+    daemon_threads = True
+    block_on_close = False
+    # Listen backlog; the socketserver default of 5 drops bursts from Ironic conductors
+    request_queue_size = 128
+    # Both must be in place before bind(); a restart can then rebind a port
+    # whose previous connections are still in TIME_WAIT
+    allow_reuse_address = True
+    allow_reuse_port = False
+    
+    def __init__(self, server_address, RequestHandlerClass, handler, reuse_port=False):
+        self.allow_reuse_port = reuse_port
         super().__init__(server_address, RequestHandlerClass)
         self.handler = handler
-        self.allow_reuse_address = True
         self.health_monitor = health_monitor
+        # Client IPs already warned about HTTPS/garbage on this port
+        self._ssl_warnings = set()
         
+    def handle_error(self, request, client_address):
+        """Keep per-connection failures out of stderr; the handler already logged them"""
+        logger.debug("📍 Connection error from %s:", client_address[0], exc_info=True)
+    
     def server_bind(self):
         """Override to ensure proper socket configuration"""
+        # socketserver only honours allow_reuse_port from Python 3.11 on
+        if self.allow_reuse_port and hasattr(socket, 'SO_REUSEPORT'):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
         super().server_bind()
-        self.socket.setsockopt(socketserver.socket.SOL_SOCKET, socketserver.socket.SO_REUSEADDR, 1)
-        logger.debug(f"🔧 Server socket configured for {self.server_address}")
+        logger.debug("🔧 Server socket configured for %s", self.server_address)
+
+
+class ListenerReactor:
+    """Accept connections for every Redfish listener from a single thread
+    
+    serve_forever() needs one thread per port, each waking every half second
+    to check for shutdown. Here all listening sockets share one selector that
+    blocks until a client connects; each accepted connection is still handed
+    to its own ThreadingMixIn worker thread.
+    """
+    
+    def __init__(self, on_exit=None):
+        self._selector = selectors.DefaultSelector()
+        # Called if the accept loop ends without stop() having been requested
+        self._on_exit = on_exit
+        # Writing to this pair wakes the selector so stop() never waits on a timeout
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._wakeup_recv.setblocking(False)
+        self._selector.register(self._wakeup_recv, selectors.EVENT_READ)
+        self._stopping = False
+        self._thread = None
+    
+    def register(self, server):
+        """Start accepting connections for a bound, listening server"""
+        self._selector.register(server, selectors.EVENT_READ)
+    
+    def start(self):
+        """Run the accept loop on a daemon thread"""
+        self._thread = threading.Thread(target=self._run, daemon=True, name="RedfishAcceptor")
+        self._thread.start()
+    
+    def _run(self):
+        try:
+            while not self._stopping:
+                for key, _ in self._selector.select():
+                    if key.fileobj is self._wakeup_recv:
+                        continue
+                    # Accepts one connection and starts its worker thread
+                    key.fileobj._handle_request_noblock()
+        except Exception as e:
+            logger.error("❌ Connection accept loop failed: %s", e)
+            logger.debug("📍 Accept loop error details:", exc_info=True)
+        finally:
+            if not self._stopping and self._on_exit is not None:
+                self._on_exit()
+    
+    def stop(self):
+        """Stop accepting connections and wait for the accept loop to exit"""
+        self._stopping = True
+        try:
+            self._wakeup_send.send(b'\0')
+        except OSError:
+            pass
+        if self._thread is not None:
+            self._thread.join()
+        self._selector.close()
+        self._wakeup_recv.close()
+        self._wakeup_send.close()
 
 
 class RedfishServer:
@@ -119,22 +228,34 @@ class RedfishServer:
         self.servers = []
         self.running = False
         self.health_monitor = health_monitor
+        # Set by stop(); the main loop and health reporter block on it instead of polling
+        self._stop_event = threading.Event()
+        # Built once in start() and shared by every HTTPS listener
+        self._ssl_context = None
+        # Shared by every listener; owns the pooled vCenter sessions
+        self._redfish_handler = None
+        # Accepts connections for every listener from one thread
+        self._reactor = None
         
         logger.info("🚀 Enhanced VMware Redfish Server initialized")
         logger.info(f"📋 Configuration loaded from: {config_path}")
         logger.info(f"💻 Managing {len(self.config.get('vms', []))} VMs")
         logger.info(f"📊 Health monitoring enabled")
         
-        # Log VM configurations (without sensitive data)
-        for vm in self.config.get('vms', []):
-            logger.info(f"🖥️  VM: {vm['name']} - vCenter: {vm['vcenter_host']} - Port: {vm['redfish_port']}")
+        # Log VM configurations (without sensitive data) as one record
+        vm_lines = [
+            f"🖥️  VM: {vm['name']} - vCenter: {vm['vcenter_host']} - Port: {vm['redfish_port']}"
+            for vm in self.config.get('vms', [])
+        ]
+        if vm_lines:
+            logger.info("\n".join(vm_lines))
     
     def _load_config(self):
         """Load and validate configuration with enhanced error reporting"""
         try:
             with create_debug_context()('Configuration Loading'):
-                with open(self.config_path, 'r') as f:
-                    config = json.load(f)
+                with open(self.config_path, 'rb') as f:
+                    config = loads(f.read())
                 
                 logger.info(f"✅ Configuration file loaded successfully")
                 
@@ -147,13 +268,13 @@ class RedfishServer:
             logger.error(f"❌ Configuration file not found: {self.config_path}")
             logger.error(f"💡 Ensure the config file exists and is readable")
             raise
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             logger.error(f"❌ Invalid JSON in configuration file: {e}")
             logger.error(f"💡 Check JSON syntax in {self.config_path}")
             raise
         except Exception as e:
             logger.error(f"❌ Error loading configuration: {e}")
-            logger.debug(f"📍 Configuration loading error:", exc_info=True)
+            logger.debug("📍 Configuration loading error:", exc_info=True)
             raise
     
     def _validate_config(self, config):
@@ -178,6 +299,7 @@ class RedfishServer:
     def start(self):
         """Start all Redfish servers with enhanced monitoring"""
         self.running = True
+        self._stop_event.clear()
         
         logger.info("🔄 Starting Enhanced VMware Redfish Server instances...")
         logger.info(f"📊 Performance monitoring and health tracking enabled")
@@ -186,17 +308,26 @@ class RedfishServer:
             with create_debug_context()('Server Startup'):
                 # Create a single Redfish handler for all VMs
                 vm_configs = self.config.get('vms', [])
-                redfish_handler = RedfishHandler(vm_configs, self.config)
+                redfish_handler = self._redfish_handler = RedfishHandler(vm_configs, self.config)
+                
+                # Every HTTPS listener serves the same certificate; read it once
+                if any(not vm_config.get('disable_ssl', False) for vm_config in vm_configs):
+                    self._ssl_context = self._build_ssl_context()
                 
                 # Start a server for each VM
+                self._reactor = ListenerReactor(on_exit=self._stop_event.set)
                 for vm_config in vm_configs:
                     self._start_vm_server(vm_config, redfish_handler)
                 
                 if self.servers:
-                    logger.info(f"🎯 All Redfish servers started successfully ({len(self.servers)} servers)")
-                    logger.info("🔍 Enhanced Metal3/Ironic compatibility enabled")
-                    logger.info("🔄 UpdateService, TaskService, and FirmwareInventory endpoints active")
-                    logger.info("📊 Health monitoring available at /redfish/v1/health")
+                    self._reactor.start()
+                    logger.info(
+                        "🎯 All Redfish servers started successfully (%d servers)\n"
+                        "🔍 Enhanced Metal3/Ironic compatibility enabled\n"
+                        "🔄 UpdateService, TaskService, and FirmwareInventory endpoints active\n"
+                        "📊 Health monitoring available at /redfish/v1/health",
+                        len(self.servers)
+                    )
                     
                     # Start health reporting thread
                     self._start_health_reporter()
@@ -209,7 +340,7 @@ class RedfishServer:
                     
         except Exception as e:
             logger.error(f"❌ Failed to start servers: {e}")
-            logger.debug(f"📍 Startup error details:", exc_info=True)
+            logger.debug("📍 Startup error details:", exc_info=True)
             self.stop()
             raise
     
@@ -220,75 +351,89 @@ class RedfishServer:
         disable_ssl = vm_config.get('disable_ssl', False)
         
         try:
-            logger.info(f"🚀 Starting Redfish server for {vm_name} on port {port}")
-            
             # Create server
             server = RedfishHTTPServer(
                 ('0.0.0.0', port),
                 RedfishRequestHandler,
-                redfish_handler
+                redfish_handler,
+                reuse_port=bool(self.config.get('reuse_port', False))
             )
             
             # Setup SSL if not disabled
             if not disable_ssl:
                 self._setup_ssl(server, vm_name, port)
             else:
-                logger.info(f"📄 HTTP mode enabled for {vm_name} (SSL disabled in config)")
-                logger.info(f"💡 Client should connect to: http://bastion.chiaret.to:{port}/redfish/v1/")
-                logger.warning(f"⚠️  HTTPS connections will FAIL - use HTTP only for {vm_name}")
-            
-            # Start server in thread
-            server_thread = threading.Thread(
-                target=server.serve_forever,
-                daemon=True,
-                name=f"RedfishServer-{vm_name}-{port}"
-            )
-            server_thread.start()
+                logger.warning(
+                    "📄 HTTP mode enabled for %s (SSL disabled in config)\n"
+                    "💡 Client should connect to: http://bastion.chiaret.to:%d/redfish/v1/\n"
+                    "⚠️  HTTPS connections will FAIL - use HTTP only for %s",
+                    vm_name, port, vm_name
+                )
             
-            self.servers.append((server, server_thread, vm_name, port))
-            logger.info(f"✅ Redfish server started for {vm_name} on port {port}")
+            self._reactor.register(server)
+            self.servers.append((server, vm_name, port))
+            logger.info("✅ Redfish server started for %s on port %d", vm_name, port)
             
         except Exception as e:
+            if isinstance(e, OSError) and e.errno == errno.EADDRINUSE:
+                owner = _describe_port_owner(port)
+                if owner:
+                    logger.error("❌ Port %d for %s is already in use by %s", port, vm_name, owner)
             logger.error(f"❌ Failed to start Redfish server for {vm_name} on port {port}: {e}")
-            logger.debug(f"📍 Server startup error for {vm_name}:", exc_info=True)
+            logger.debug("📍 Server startup error for %s:", vm_name, exc_info=True)
     
-    def _setup_ssl(self, server, vm_name, port):
-        """Setup SSL configuration for a server"""
+    def _build_ssl_context(self):
+        """Load the configured certificate once and return a context for every HTTPS listener"""
         ssl_config = self.config.get('ssl', {})
         ssl_cert_path = ssl_config.get('cert_path')
         ssl_key_path = ssl_config.get('key_path')
         
         if not ssl_cert_path or not ssl_key_path:
-            logger.warning(f"⚠️  SSL cert_path/key_path not defined in config, running HTTP only for {vm_name}")
-            logger.warning(f"💡 Add 'ssl' section with 'cert_path' and 'key_path' to config.json to enable HTTPS")
-            return
+            logger.warning(
+                "⚠️  SSL cert_path/key_path not defined in config, running HTTP only\n"
+                "💡 Add 'ssl' section with 'cert_path' and 'key_path' to config.json to enable HTTPS"
+            )
+            return None
         
         try:
             if os.path.exists(ssl_cert_path) and os.path.exists(ssl_key_path):
                 context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
                 context.load_cert_chain(ssl_cert_path, ssl_key_path)
-                server.socket = context.wrap_socket(server.socket, server_side=True)
-                logger.info(f"🔒 HTTPS enabled for {vm_name} using certificates from config")
-                logger.info(f"   cert: {ssl_cert_path}")
-            else:
-                logger.warning(f"⚠️  SSL certificates not found, running HTTP only for {vm_name}")
-                logger.warning(f"   Expected: {ssl_cert_path} and {ssl_key_path}")
+                logger.info("🔒 SSL certificate loaded from config\n   cert: %s", ssl_cert_path)
+                return context
+            logger.warning("⚠️  SSL certificates not found, running HTTP only\n   Expected: %s and %s",
+                           ssl_cert_path, ssl_key_path)
+        except Exception as ssl_error:
+            logger.warning(f"⚠️  HTTPS setup failed, falling back to HTTP: {ssl_error}")
+        return None
+    
+    def _setup_ssl(self, server, vm_name, port):
+        """Wrap a server socket with the shared SSL context"""
+        if self._ssl_context is None:
+            logger.warning("⚠️  No usable SSL certificate, running HTTP only for %s", vm_name)
+            return
+        
+        try:
+            # The handshake runs in the connection's worker thread (see
+            # RedfishRequestHandler.setup), not in the shared accept loop
+            server.socket = self._ssl_context.wrap_socket(server.socket, server_side=True,
+                                                          do_handshake_on_connect=False)
+            logger.info("🔒 HTTPS enabled for %s using certificates from config", vm_name)
         except Exception as ssl_error:
             logger.warning(f"⚠️  HTTPS setup failed for {vm_name}, falling back to HTTP: {ssl_error}")
     
     def _start_health_reporter(self):
         """Start background thread for periodic health reporting"""
         def health_reporter():
-            while self.running:
+            while not self._stop_event.wait(HEALTH_REPORT_INTERVAL):
                 try:
-                    time.sleep(300)  # Report every 5 minutes
                     if self.running:
                         stats = self.health_monitor.get_health_stats()
                         logger.info(f"📊 Health Report - Uptime: {stats['uptime_human']}, "
                                   f"Operations: {stats['total_operations']}, "
                                   f"Success Rate: {stats['success_rate']:.1f}%")
                 except Exception as e:
-                    logger.debug(f"🔧 Health reporter error: {e}")
+                    logger.debug("🔧 Health reporter error: %s", e)
         
         health_thread = threading.Thread(target=health_reporter, daemon=True, name="HealthReporter")
         health_thread.start()
@@ -300,32 +445,53 @@ class RedfishServer:
             logger.info("✅ Redfish VMware Server is running")
             logger.info("💡 Press Ctrl+C to stop the server")
             
-            while self.running:
-                time.sleep(1)
+            # systemd stops the service with SIGTERM; treat it like Ctrl+C
+            signal.signal(signal.SIGTERM, signal.default_int_handler)
+            self._stop_event.wait()
+            
+            # stop() clears running before setting the event; if it is still
+            # set, the accept loop died and woke us up instead
+            if self.running:
+                logger.error("❌ Connection accept loop exited unexpectedly, shutting down")
+                self.stop()
+                sys.exit(1)
                 
         except KeyboardInterrupt:
-            logger.info("🛑 Received shutdown signal (Ctrl+C)")
+            logger.info("🛑 Received shutdown signal (Ctrl+C/SIGTERM)")
             self.stop()
         except Exception as e:
             logger.error(f"❌ Main loop error: {e}")
-            logger.debug(f"📍 Main loop error details:", exc_info=True)
+            logger.debug("📍 Main loop error details:", exc_info=True)
             self.stop()
     
     def stop(self):
         """Stop all Redfish servers with enhanced cleanup"""
         logger.info("🛑 Stopping Enhanced Redfish VMware Server...")
         self.running = False
+        self._stop_event.set()
         
         with create_debug_context()('Server Shutdown'):
-            for server, thread, vm_name, port in self.servers:
+            # Stop accepting on every port before closing the sockets
+            reactor, self._reactor = self._reactor, None
+            if reactor is not None:
+                reactor.stop()
+            
+            for server, vm_name, port in self.servers:
                 try:
                     logger.info(f"🛑 Stopping server for {vm_name} on port {port}")
-                    server.shutdown()
                     server.server_close()
                     logger.info(f"✅ Server stopped for {vm_name}")
                 except Exception as e:
                     logger.error(f"❌ Error stopping server for {vm_name}: {e}")
             
+            # Log out of each pooled vCenter session once the listeners are down
+            redfish_handler, self._redfish_handler = self._redfish_handler, None
+            if redfish_handler is not None:
+                try:
+                    redfish_handler.shutdown()
+                except Exception as e:
+                    logger.error(f"❌ Error shutting down Redfish handler: {e}")
+            
             # Log final statistics
             final_stats = self.health_monitor.get_health_stats()
             logger.info(f"📊 Final Statistics:")
@@ -348,8 +514,9 @@ def main():
     parser = argparse.ArgumentParser(description='VMware Redfish Server - Modularized')
     parser.add_argument(
         '--config', 
-        default=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config', 'config.json'),
-        help='Configuration file path'
+        default=os.environ.get('REDFISH_CONFIG') or os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config', 'config.json'),
+        help='Configuration file path (default: $REDFISH_CONFIG or config/config.json)'
     )
     
     args = parser.parse_args()
@@ -42,7 +42,7 @@ class TaskManager:
                                 completed_tasks.append(task_id)
                         
                         for task_id in completed_tasks:
-                            logger.debug(f"🧹 Cleaning up completed task: {task_id}")
+                            logger.debug("🧹 Cleaning up completed task: %s", task_id)
                             del self.tasks[task_id]
                     
                     # Sleep for 30 seconds
@@ -137,7 +137,7 @@ class TaskManager:
                         'Severity': 'OK',
                         'Timestamp': datetime.now(tz=timezone.utc).isoformat()
                     })
-                logger.debug(f"📊 Task {task_id} progress: {percent_complete}%")
+                logger.debug("📊 Task %s progress: %s%%", task_id, percent_complete)
     
     def complete_task(self, task_id: str, message: str = None, success: bool = True):
         """Mark task as completed"""
@@ -3,17 +3,29 @@
 Enhanced Logging Configuration Module
 Provides comprehensive logging configuration for the Redfish VMware Server
 with advanced debugging capabilities and performance monitoring.
+
+Set REDFISH_LOG_FILE to log to a fixed file and skip the search of
+REDFISH_LOG_DIR, the home directory and the working directory. Set
+REDFISH_LOG_CONSOLE=false to stop echoing records to stdout when a log
+file is in use.
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 import threading
 import time
 from datetime import datetime
 
 
+# Records held before the log file is written, and the longest they wait
+LOG_BUFFER_CAPACITY = 1024
+LOG_FLUSH_INTERVAL = 1.0
+
+
 class PerformanceFilter(logging.Filter):
     """Filter to add performance metrics to log records"""
     
@@ -36,14 +48,46 @@ class VmwareContextFilter(logging.Filter):
     """Filter to add VMware operation context to log records"""
     
     def filter(self, record):
-        # Add context information if available
-        if hasattr(record, 'vm_name'):
-            record.msg = f"[VM: {record.vm_name}] {record.msg}"
-        if hasattr(record, 'operation'):
-            record.msg = f"[OP: {record.operation}] {record.msg}"
+        # Add context information if available; records logged without an
+        # adapter carry neither attribute and pass through untouched
+        vm_name = record.__dict__.get('vm_name')
+        operation = record.__dict__.get('operation')
+        if vm_name is not None:
+            record.msg = f"[VM: {vm_name}] {record.msg}"
+        if operation is not None:
+            record.msg = f"[OP: {operation}] {record.msg}"
         return True
 
 
+def _find_log_file():
+    """Return the first candidate log path this process can write to, or None"""
+    log_dir = os.getenv('REDFISH_LOG_DIR', '/var/log')
+    log_paths = [
+        os.path.join(log_dir, 'redfish-vmware-server.log'),
+        os.path.expanduser('~/redfish-vmware-server.log'),
+        './redfish-vmware-server.log'
+    ]
+    
+    for path in log_paths:
+        # Probe permissions instead of opening each candidate for append;
+        # an existing writable log (every restart after the first) is one access() call
+        if os.access(path, os.W_OK):
+            return path
+        if os.path.exists(path):
+            continue
+        
+        # Only a missing REDFISH_LOG_DIR needs creating; don't attempt mkdir on existing dirs
+        directory = os.path.dirname(path) or '.'
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                continue
+        if os.access(directory, os.W_OK | os.X_OK):
+            return path
+    return None
+
+
 def setup_logging():
     """Setup enhanced logging configuration with advanced debugging features"""
     # Get configuration from environment
@@ -73,33 +117,20 @@ def setup_logging():
     print(f"⚡ VMware operation tracking: {'ON' if vmware_debug else 'OFF'}")
 
     # Setup log file paths with rotation
-    log_dir = os.getenv('REDFISH_LOG_DIR', '/var/log')
-    log_paths = [
-        os.path.join(log_dir, 'redfish-vmware-server.log'),
-        os.path.expanduser('~/redfish-vmware-server.log'),
-        './redfish-vmware-server.log'
-    ]
-
-    log_file = None
-    for path in log_paths:
-        try:
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, 'a') as f:
-                pass
-            log_file = path
-            break
-        except (PermissionError, FileNotFoundError, OSError):
-            continue
+    log_file = os.getenv('REDFISH_LOG_FILE') or _find_log_file()
 
     # Create handlers
     handlers = []
     
-    # Console handler with color support
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
-    handlers.append(console_handler)
+    # Console handler with color support; REDFISH_LOG_CONSOLE=false leaves the
+    # log file as the only destination, so each record is formatted once
+    if not log_file or os.getenv('REDFISH_LOG_CONSOLE', 'true').lower() in ['true', '1', 'yes', 'on']:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(log_level)
+        handlers.append(console_handler)
     
     # File handler with rotation if log file is available
+    file_handler = None
     if log_file:
         # Use rotating file handler to prevent large log files
         file_handler = logging.handlers.RotatingFileHandler(
@@ -129,18 +160,46 @@ def setup_logging():
     formatter = logging.Formatter(log_format)
     for handler in handlers:
         handler.setFormatter(formatter)
-        
-        # Add filters for enhanced debugging
-        if performance_debug or debug_enabled:
-            handler.addFilter(PerformanceFilter())
-        if vmware_debug or debug_enabled:
-            handler.addFilter(VmwareContextFilter())
+
+    # Buffer file records and write them in batches; errors flush immediately
+    # and a background timer bounds how long anything stays in memory
+    if file_handler is not None:
+        buffered_file_handler = logging.handlers.MemoryHandler(
+            LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+        buffered_file_handler.setLevel(file_handler.level)
+        handlers[handlers.index(file_handler)] = buffered_file_handler
+        _start_periodic_flush(buffered_file_handler, LOG_FLUSH_INTERVAL)
+
+    # No format uses the process fields; skip collecting them for every record
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    # Request threads only enqueue records; a single listener thread does the
+    # console/file I/O so a slow disk never stalls request handling
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # Merge args (and any traceback) into the message before it crosses threads
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+    # Filters run in the logging thread, so thread name and context are captured
+    # before the record is queued
+    if performance_debug or debug_enabled:
+        queue_handler.addFilter(PerformanceFilter())
+    if vmware_debug or debug_enabled:
+        queue_handler.addFilter(VmwareContextFilter())
+
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
 
     # Configure root logger
     logging.basicConfig(
         level=log_level,
-        handlers=handlers,
-        format=log_format
+        handlers=[queue_handler]
     )
 
     # Get main logger
@@ -149,8 +208,7 @@ def setup_logging():
     # Log startup information
     if log_file:
         logger.info(f"📝 Logging to: {log_file}")
-        if isinstance(handlers[1], logging.handlers.RotatingFileHandler):
-            logger.info(f"🔄 Log rotation enabled: 50MB max, 5 backups")
+        logger.info(f"🔄 Log rotation enabled: 50MB max, 5 backups")
 
     # Log debug mode status
     if debug_enabled:
@@ -170,22 +228,37 @@ def setup_logging():
     return logger
 
 
+def _start_periodic_flush(handler, interval):
+    """Flush a buffering handler every interval seconds from a daemon thread"""
+    stop = threading.Event()
+
+    def flush_loop():
+        while not stop.wait(interval):
+            handler.flush()
+
+    threading.Thread(target=flush_loop, name='log-flush', daemon=True).start()
+    atexit.register(stop.set)
+
+
+# Third-party loggers held at WARNING outside full debug mode
+_QUIET_LOGGERS = ('urllib3', 'requests', 'pyVmomi', 'suds')
+
+# VMware logger levels with and without VMware operation tracking
+_VMWARE_DEBUG_LEVELS = {'vmware': logging.DEBUG, 'pyVim': logging.INFO}
+_VMWARE_QUIET_LEVELS = {'vmware': logging.WARNING, 'pyVim': logging.WARNING}
+
+
 def configure_third_party_logging(debug_enabled, vmware_debug):
     """Configure logging for third-party libraries"""
     # Reduce noise from third-party libraries unless in full debug mode
     if not debug_enabled:
-        logging.getLogger('urllib3').setLevel(logging.WARNING)
-        logging.getLogger('requests').setLevel(logging.WARNING)
-        logging.getLogger('pyVmomi').setLevel(logging.WARNING)
-        logging.getLogger('suds').setLevel(logging.WARNING)
+        for name in _QUIET_LOGGERS:
+            logging.getLogger(name).setLevel(logging.WARNING)
     
     # VMware-specific logging
-    if vmware_debug or debug_enabled:
-        logging.getLogger('vmware').setLevel(logging.DEBUG)
-        logging.getLogger('pyVim').setLevel(logging.INFO)
-    else:
-        logging.getLogger('vmware').setLevel(logging.WARNING)
-        logging.getLogger('pyVim').setLevel(logging.WARNING)
+    vmware_levels = _VMWARE_DEBUG_LEVELS if (vmware_debug or debug_enabled) else _VMWARE_QUIET_LEVELS
+    for name, level in vmware_levels.items():
+        logging.getLogger(name).setLevel(level)
 
 
 def get_logger(name):
@@ -195,48 +268,62 @@ def get_logger(name):
 
 
 def log_vmware_operation(logger, operation, vm_name=None, **kwargs):
-    """Log VMware operations with context"""
+    """Return a LoggerAdapter that tags every record with the operation and VM
+    
+    Build it once per VM or operation and keep it; messages then stay plain
+    %-style templates and VmwareContextFilter adds the context prefix.
+    """
     extra = {'operation': operation}
     if vm_name:
         extra['vm_name'] = vm_name
     
     # Add additional context
-    for key, value in kwargs.items():
-        extra[key] = value
+    extra.update(kwargs)
     
-    return logger
+    return logging.LoggerAdapter(logger, extra)
 
 
 def log_performance_metric(logger, operation, duration, success=True, **kwargs):
     """Log performance metrics for operations"""
-    status = "✅" if success else "❌"
-    message = f"{status} {operation} completed in {duration:.3f}s"
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
+    status = "✅" if success else "❌"
     if kwargs:
         details = ", ".join(f"{k}={v}" for k, v in kwargs.items())
-        message += f" ({details})"
+        logger.info("%s %s completed in %.3fs (%s)", status, operation, duration, details)
+    else:
+        logger.info("%s %s completed in %.3fs", status, operation, duration)
+
+
+class DebugContext:
+    """Log the start, completion and duration of an operation at debug level"""
+    
+    def __init__(self, operation_name):
+        self.operation_name = operation_name
+        self.start_time = None
+        self.logger = _debug_context_logger
     
-    logger.info(message)
+    def __enter__(self):
+        self.start_time = time.time()
+        self.logger.debug("🔧 Starting operation: %s", self.operation_name)
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        duration = time.time() - self.start_time
+        if exc_type is None:
+            self.logger.debug("✅ Operation completed: %s (%.3fs)", self.operation_name, duration)
+        else:
+            self.logger.error("❌ Operation failed: %s (%.3fs) - %s", self.operation_name, duration, exc_val)
+
+
+_debug_context_logger = get_logger(__name__)
 
 
 def create_debug_context():
-    """Create a context manager for debug operations"""
-    class DebugContext:
-        def __init__(self, operation_name):
-            self.operation_name = operation_name
-            self.start_time = None
-            self.logger = get_logger(__name__)
-        
-        def __enter__(self):
-            self.start_time = time.time()
-            self.logger.debug(f"🔧 Starting operation: {self.operation_name}")
-            return self
-        
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            duration = time.time() - self.start_time
-            if exc_type is None:
-                self.logger.debug(f"✅ Operation completed: {self.operation_name} ({duration:.3f}s)")
-            else:
-                self.logger.error(f"❌ Operation failed: {self.operation_name} ({duration:.3f}s) - {exc_val}")
+    """Return the context manager class for debug operations
     
+    The class is defined once at module level; callers wrap every request in
+    it, so it is not rebuilt per call.
+    """
     return DebugContext
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+JSON Serialization Helpers
+Encodes Redfish payloads straight to UTF-8 bytes, using orjson when it is
+installed and falling back to the standard library json module otherwise.
+"""
+
+import json
+from collections.abc import Mapping
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so callers can catch one type
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(obj):
+    """Encode the read-only mappings models.redfish_schemas shares between callers"""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _orjson_dumps = orjson.dumps
+    _orjson_loads = orjson.loads
+    _OPT_INDENT_2 = orjson.OPT_INDENT_2
+
+    def dumps(data, pretty: bool = False) -> bytes:
+        """Serialize data to compact JSON bytes, or indented by two spaces when pretty"""
+        return _orjson_dumps(data, default=_default, option=_OPT_INDENT_2 if pretty else 0)
+
+    def loads(data):
+        """Deserialize JSON from bytes or str"""
+        return _orjson_loads(data)
+else:
+    # json.dumps() with non-default arguments builds a new encoder per call;
+    # these are built once and are safe to share between threads
+    _compact_encode = json.JSONEncoder(separators=(',', ':'), default=_default).encode
+    _pretty_encode = json.JSONEncoder(indent=2, default=_default).encode
+    _json_loads = json.loads
+
+    def dumps(data, pretty: bool = False) -> bytes:
+        """Serialize data to compact JSON bytes, or indented by two spaces when pretty"""
+        if pretty:
+            return _pretty_encode(data).encode('utf-8')
+        return _compact_encode(data).encode('utf-8')
+
+    def loads(data):
+        """Deserialize JSON from bytes or str"""
+        return _json_loads(data)
@@ -71,9 +71,11 @@ class VMwareConnection:
     
     def disconnect(self):
         """Disconnect from VMware vSphere"""
+        # Shutdown and the atexit hook both call this; only the first logs out
+        service_instance, self.service_instance = self.service_instance, None
         try:
-            if self.service_instance:
-                Disconnect(self.service_instance)
+            if service_instance:
+                Disconnect(service_instance)
                 logger.info("Disconnected from VMware")
         except Exception as e:
             logger.error(f"Error disconnecting: {e}")
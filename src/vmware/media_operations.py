@@ -5,10 +5,18 @@ Handles ISO mounting, boot order, and virtual media operations.
 """
 
 import logging
+import time
 from pyVmomi import vim
 
 logger = logging.getLogger(__name__)
 
+# Boot order device names mapped to their vSphere bootable device types
+_BOOT_DEVICE_TYPES = {
+    'cdrom': vim.vm.BootOptions.BootableCdromDevice,
+    'disk': vim.vm.BootOptions.BootableDiskDevice,
+    'network': vim.vm.BootOptions.BootableEthernetDevice,
+}
+
 
 class MediaOperations:
     """Virtual media and boot operations"""
@@ -46,12 +54,9 @@ class MediaOperations:
             # Create boot options
             boot_options = []
             for device in boot_order:
-                if device.lower() == 'cdrom':
-                    boot_options.append(vim.vm.BootOptions.BootableCdromDevice())
-                elif device.lower() == 'disk':
-                    boot_options.append(vim.vm.BootOptions.BootableDiskDevice())
-                elif device.lower() == 'network':
-                    boot_options.append(vim.vm.BootOptions.BootableEthernetDevice())
+                device_type = _BOOT_DEVICE_TYPES.get(device.lower())
+                if device_type is not None:
+                    boot_options.append(device_type())
             
             # Configure boot options
             boot_spec = vim.vm.BootOptions()
@@ -197,7 +202,6 @@ class MediaOperations:
             True if task completed successfully, False otherwise
         """
         try:
-            import time
             while task.info.state in ['running', 'queued']:
                 time.sleep(1)
             
@@ -9,6 +9,14 @@ import time
 
 logger = logging.getLogger(__name__)
 
+# Seconds between VM state checks while waiting on guest shutdown/restart
+STATE_POLL_INTERVAL = 0.5
+# First and longest wait between vCenter task state checks
+TASK_POLL_INITIAL = 0.1
+TASK_POLL_MAX = 1.0
+
+_TOOLS_READY = ('toolsOk', 'toolsOld')
+
 
 class PowerOperations:
     """VM power management operations"""
@@ -158,12 +166,9 @@ class PowerOperations:
             vm.ShutdownGuest()
             
             # Wait for shutdown to complete (up to 60 seconds)
-            for i in range(60):
-                time.sleep(1)
-                vm_info = self.vm_operations.get_vm(vm_name)
-                if vm_info and vm_info.runtime.powerState == 'poweredOff':
-                    logger.info(f"Successfully shutdown VM '{vm_name}'")
-                    return True
+            if self._wait_until(lambda: vm.runtime.powerState == 'poweredOff', 60):
+                logger.info(f"Successfully shutdown VM '{vm_name}'")
+                return True
             
             # If graceful shutdown didn't work, force power off
             logger.warning(f"Graceful shutdown timed out for '{vm_name}', forcing power off")
@@ -201,19 +206,13 @@ class PowerOperations:
             logger.info(f"Gracefully restarting VM '{vm_name}'")
             vm.RebootGuest()
             
-            # Wait a moment for the restart to begin
-            time.sleep(5)
+            # Wait for the restart to begin (tools stop answering), up to 5 seconds
+            self._wait_until(lambda: not self._guest_ready(vm), 5)
             
             # Wait for the VM to come back online (up to 120 seconds)
-            for i in range(120):
-                time.sleep(1)
-                vm_current = self.vm_operations.get_vm(vm_name)
-                if (vm_current and 
-                    vm_current.runtime.powerState == 'poweredOn' and 
-                    vm_current.guest and 
-                    vm_current.guest.toolsStatus in ['toolsOk', 'toolsOld']):
-                    logger.info(f"Successfully restarted VM '{vm_name}'")
-                    return True
+            if self._wait_until(lambda: self._guest_ready(vm), 120):
+                logger.info(f"Successfully restarted VM '{vm_name}'")
+                return True
             
             logger.warning(f"Restart verification timed out for '{vm_name}', but command was sent")
             return True
@@ -233,8 +232,11 @@ class PowerOperations:
             True if task completed successfully, False otherwise
         """
         try:
+            # Back off from a short first check so quick tasks return promptly
+            delay = TASK_POLL_INITIAL
             while task.info.state in ['running', 'queued']:
-                time.sleep(1)
+                time.sleep(delay)
+                delay = min(delay * 2, TASK_POLL_MAX)
             
             if task.info.state == 'success':
                 return True
@@ -245,3 +247,24 @@ class PowerOperations:
         except Exception as e:
             logger.error(f"Error waiting for task: {e}")
             return False
+    
+    def _guest_ready(self, vm):
+        """Return True when the VM is powered on and VMware Tools is running"""
+        return (vm.runtime.powerState == 'poweredOn' and
+                vm.guest is not None and
+                vm.guest.toolsStatus in _TOOLS_READY)
+    
+    def _wait_until(self, condition, timeout, interval=STATE_POLL_INTERVAL):
+        """
+        Poll condition until it returns True or timeout seconds pass
+        
+        Returns:
+            True if the condition was met, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+        while not condition():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(interval, remaining))
+        return True
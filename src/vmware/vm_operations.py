@@ -5,10 +5,16 @@ Handles VM discovery, information retrieval, and basic operations.
 """
 
 import logging
-from pyVmomi import vim
+import threading
+import time
+from pyVmomi import vim, vmodl
 
 logger = logging.getLogger(__name__)
 
+# Seconds a VM name -> managed object lookup is reused before searching the inventory again
+VM_LOOKUP_TTL = 300
+VM_LOOKUP_MAX_ENTRIES = 256
+
 
 class VMOperations:
     """VM operations management"""
@@ -22,17 +28,57 @@ class VMOperations:
         """
         self.connection = connection
         self.content = connection.get_content()
+        self._vm_cache = {}  # vm_name -> (expires_at, VM managed object)
+        self._vm_cache_lock = threading.Lock()
     
     def get_vm(self, vm_name):
         """
         Get VM object by name
         
+        Finding a VM walks every VM in the inventory and fetches its name, so
+        the managed object is reused for VM_LOOKUP_TTL seconds; power and media
+        operations only need the reference and read live properties from it.
+        A cached reference is confirmed with a single name read before reuse;
+        if the VM was deleted or renamed (Metal3 re-creates VMs under the same
+        name) the entry is dropped and the inventory searched again.
+        
         Args:
             vm_name: Name of the virtual machine
             
         Returns:
             VM object or None if not found
         """
+        now = time.monotonic()
+        cached = self._vm_cache.get(vm_name)
+        if cached is not None and cached[0] > now:
+            if self._still_named(cached[1], vm_name):
+                return cached[1]
+            logger.info("♻️ Cached reference for VM '%s' is stale; looking it up again", vm_name)
+            self.forget_vm(vm_name)
+        
+        vm = self._find_vm(vm_name)
+        if vm is not None:
+            with self._vm_cache_lock:
+                if vm_name not in self._vm_cache and len(self._vm_cache) >= VM_LOOKUP_MAX_ENTRIES:
+                    self._vm_cache.pop(next(iter(self._vm_cache)))
+                self._vm_cache[vm_name] = (now + VM_LOOKUP_TTL, vm)
+        return vm
+    
+    def forget_vm(self, vm_name):
+        """Drop the cached managed object for a VM"""
+        with self._vm_cache_lock:
+            self._vm_cache.pop(vm_name, None)
+    
+    @staticmethod
+    def _still_named(vm, vm_name):
+        """Check that a cached VM reference still exists under the same name"""
+        try:
+            return vm.name == vm_name
+        except vmodl.fault.ManagedObjectNotFound:
+            return False
+    
+    def _find_vm(self, vm_name):
+        """Search the inventory for a VM by name"""
         try:
             container = self.content.viewManager.CreateContainerView(
                 self.content.rootFolder,
@@ -136,3 +182,63 @@ class VMOperations:
         except Exception as e:
             logger.error(f"Error getting power state for '{vm_name}': {e}")
             return None
+    
+    def get_vm_power_states(self, vm_names):
+        """
+        Get the power state of several VMs with one PropertyCollector query
+        
+        Reading runtime.powerState from each VM object costs one vCenter round
+        trip per VM; the PropertyCollector returns name and power state for
+        every VM in the inventory in a single call (plus continuation pages).
+        
+        Args:
+            vm_names: Names of the virtual machines
+            
+        Returns:
+            Dictionary of VM name -> power state for the VMs that were found
+            
+        Raises:
+            Exception: vCenter errors are logged and re-raised, so an outage is
+            not mistaken for missing VMs
+        """
+        wanted = set(vm_names)
+        states = {}
+        try:
+            container = self.content.viewManager.CreateContainerView(
+                self.content.rootFolder,
+                [vim.VirtualMachine],
+                True
+            )
+            try:
+                collector_types = vmodl.query.PropertyCollector
+                traversal = collector_types.TraversalSpec(
+                    name='traverseView',
+                    path='view',
+                    skip=False,
+                    type=vim.view.ContainerView
+                )
+                filter_spec = collector_types.FilterSpec(
+                    objectSet=[collector_types.ObjectSpec(obj=container, skip=True, selectSet=[traversal])],
+                    propSet=[collector_types.PropertySpec(type=vim.VirtualMachine,
+                                                          pathSet=['name', 'runtime.powerState'])]
+                )
+                
+                collector = self.content.propertyCollector
+                result = collector.RetrievePropertiesEx([filter_spec], collector_types.RetrieveOptions())
+                while result:
+                    for obj in result.objects:
+                        props = {prop.name: prop.val for prop in obj.propSet}
+                        name = props.get('name')
+                        if name in wanted:
+                            states[name] = props.get('runtime.powerState')
+                    if not result.token:
+                        break
+                    result = collector.ContinueRetrievePropertiesEx(result.token)
+            finally:
+                container.Destroy()
+            
+        except Exception as e:
+            logger.error("Error getting power states for %d VMs: %s", len(wanted), e)
+            raise
+        
+        return states
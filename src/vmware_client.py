@@ -26,11 +26,11 @@ def track_vmware_operation(operation_name):
         @wraps(func)
         def wrapper(self, *args, **kwargs):
             start_time = time.time()
-            vm_name = getattr(self, '_current_vm_name', 'unknown')
+            vm_name = self._current_vm_name
             
             # Log operation start
-            logger.info(f"🔧 [{operation_name}] Starting for VM: {vm_name}")
-            logger.debug(f"📋 [{operation_name}] Args: {args}, Kwargs: {kwargs}")
+            logger.info("🔧 [%s] Starting for VM: %s", operation_name, vm_name)
+            logger.debug("📋 [%s] Args: %s, Kwargs: %s", operation_name, args, kwargs)
             
             try:
                 # Execute the operation
@@ -38,7 +38,7 @@ def track_vmware_operation(operation_name):
                 
                 # Log success
                 duration = time.time() - start_time
-                logger.info(f"✅ [{operation_name}] Completed for VM: {vm_name} in {duration:.3f}s")
+                logger.info("✅ [%s] Completed for VM: %s in %.3fs", operation_name, vm_name, duration)
                 log_performance_metric(logger, operation_name, duration, True, vm_name=vm_name)
                 
                 return result
@@ -46,7 +46,7 @@ def track_vmware_operation(operation_name):
             except Exception as e:
                 # Log failure
                 duration = time.time() - start_time
-                logger.error(f"❌ [{operation_name}] Failed for VM: {vm_name} after {duration:.3f}s: {e}")
+                logger.error("❌ [%s] Failed for VM: %s after %.3fs: %s", operation_name, vm_name, duration, e)
                 log_performance_metric(logger, operation_name, duration, False, 
                                      vm_name=vm_name, error=str(e))
                 raise
@@ -87,8 +87,8 @@ class VMwareClient:
         
         self.disable_ssl_verification = disable_ssl_verification
         
-        logger.info(f"🔗 Initializing VMware client for {host}:{port}")
-        logger.info(f"👤 User: {user}, SSL Verification: {'Disabled' if disable_ssl_verification else 'Enabled'}")
+        logger.info("🔗 Initializing VMware client for %s:%s", host, port)
+        logger.info("👤 User: %s, SSL Verification: %s", user, 'Disabled' if disable_ssl_verification else 'Enabled')
         
         try:
             with create_debug_context()('VMware Connection Initialization'):
@@ -100,169 +100,30 @@ class VMwareClient:
                 self.power_ops = PowerOperations(self.connection, self.vm_ops)
                 self.media_ops = MediaOperations(self.connection, self.vm_ops)
                 
-            logger.info(f"✅ VMware client initialized successfully for {host}")
+            logger.info("✅ VMware client initialized successfully for %s", host)
             
         except Exception as e:
-            logger.error(f"❌ Failed to initialize VMware client for {host}: {e}")
-            logger.debug(f"📍 Connection error details:", exc_info=True)
+            logger.error("❌ Failed to initialize VMware client for %s: %s", host, e)
+            logger.debug("📍 Connection error details:", exc_info=True)
             raise
     
     def set_current_vm(self, vm_name):
         """Set the current VM name for logging context"""
         self._current_vm_name = vm_name
-        logger.debug(f"🎯 Current VM context set to: {vm_name}")
-    
-    @track_vmware_operation("VMware Disconnect")
-    def disconnect(self):
-        """Disconnect from VMware vSphere with enhanced logging"""
-        logger.info(f"🔌 Disconnecting from VMware host: {self.host}")
-        try:
-            self.connection.disconnect()
-            logger.info(f"✅ Successfully disconnected from {self.host}")
-        except Exception as e:
-            logger.warning(f"⚠️ Error during disconnection from {self.host}: {e}")
-    
-    def is_connected(self):
-        """Check if connection is active with enhanced logging"""
-        try:
-            connected = self.connection.is_connected()
-            logger.debug(f"🔍 Connection status for {self.host}: {'Connected' if connected else 'Disconnected'}")
-            return connected
-        except Exception as e:
-            logger.warning(f"⚠️ Error checking connection status for {self.host}: {e}")
-            return False
-    
-    @track_vmware_operation("List VMs")
-    def list_vms(self):
-        """List all VMs with enhanced logging"""
-        logger.debug(f"📋 Listing all VMs on {self.host}")
-        try:
-            vms = self.vm_ops.list_vms()
-            logger.info(f"📊 Found {len(vms)} VMs on {self.host}")
-            
-            # Log VM details in debug mode
-            for vm in vms:
-                logger.debug(f"  📦 VM: {vm}")
-            
-            return vms
-        except Exception as e:
-            logger.error(f"❌ Failed to list VMs on {self.host}: {e}")
-            raise
-    
-    @track_vmware_operation("Get VM Info")
-    def get_vm_info(self, vm_name):
-        """Get VM information with enhanced logging"""
-        self.set_current_vm(vm_name)
-        logger.debug(f"🔍 Getting info for VM: {vm_name}")
-        
-        try:
-            vm_info = self.vm_ops.get_vm_info(vm_name)
-            if vm_info:
-                logger.info(f"✅ VM info retrieved for {vm_name}: Power={vm_info.get('power_state', 'unknown')}")
-                logger.debug(f"📋 Full VM info for {vm_name}: {vm_info}")
-            else:
-                logger.warning(f"⚠️ VM not found: {vm_name}")
-            return vm_info
-        except Exception as e:
-            logger.error(f"❌ Failed to get VM info for {vm_name}: {e}")
-            raise
-    
-    @track_vmware_operation("Power On VM")
-    def power_on_vm(self, vm_name):
-        """Power on VM with enhanced logging"""
-        self.set_current_vm(vm_name)
-        logger.info(f"⚡ Powering on VM: {vm_name}")
-        
-        try:
-            result = self.power_ops.power_on(vm_name)
-            logger.info(f"✅ Power on command sent for VM: {vm_name}")
-            return result
-        except Exception as e:
-            logger.error(f"❌ Failed to power on VM {vm_name}: {e}")
-            raise
-    
-    @track_vmware_operation("Power Off VM")
-    def power_off_vm(self, vm_name):
-        """Power off VM with enhanced logging"""
-        self.set_current_vm(vm_name)
-        logger.info(f"🔌 Powering off VM: {vm_name}")
-        
-        try:
-            result = self.power_ops.power_off(vm_name)
-            logger.info(f"✅ Power off command sent for VM: {vm_name}")
-            return result
-        except Exception as e:
-            logger.error(f"❌ Failed to power off VM {vm_name}: {e}")
-            raise
-    
-    @track_vmware_operation("Reset VM")
-    def reset_vm(self, vm_name):
-        """Reset VM with enhanced logging"""
-        self.set_current_vm(vm_name)
-        logger.info(f"🔄 Resetting VM: {vm_name}")
-        
-        try:
-            result = self.power_ops.reset(vm_name)
-            logger.info(f"✅ Reset command sent for VM: {vm_name}")
-            return result
-        except Exception as e:
-            logger.error(f"❌ Failed to reset VM {vm_name}: {e}")
-            raise
-    
-    @track_vmware_operation("Shutdown VM")
-    def shutdown_vm(self, vm_name):
-        """Gracefully shutdown VM with enhanced logging"""
-        self.set_current_vm(vm_name)
-        logger.info(f"🛑 Gracefully shutting down VM: {vm_name}")
-        
-        try:
-            result = self.power_ops.shutdown(vm_name)
-            logger.info(f"✅ Shutdown command sent for VM: {vm_name}")
-            return result
-        except Exception as e:
-            logger.error(f"❌ Failed to shutdown VM {vm_name}: {e}")
-            raise
-    
-    @track_vmware_operation("Mount ISO")
-    def mount_iso(self, vm_name, iso_path):
-        """Mount ISO with enhanced logging"""
-        self.set_current_vm(vm_name)
-        logger.info(f"💿 Mounting ISO for VM {vm_name}: {iso_path}")
-        
-        try:
-            result = self.media_ops.mount_iso(vm_name, iso_path)
-            logger.info(f"✅ ISO mounted successfully for VM {vm_name}")
-            return result
-        except Exception as e:
-            logger.error(f"❌ Failed to mount ISO for VM {vm_name}: {e}")
-            raise
-    
-    @track_vmware_operation("Unmount ISO")
-    def unmount_iso(self, vm_name):
-        """Unmount ISO with enhanced logging"""
-        self.set_current_vm(vm_name)
-        logger.info(f"💿 Unmounting ISO for VM: {vm_name}")
-        
-        try:
-            result = self.media_ops.unmount_iso(vm_name)
-            logger.info(f"✅ ISO unmounted successfully for VM {vm_name}")
-            return result
-        except Exception as e:
-            logger.error(f"❌ Failed to unmount ISO for VM {vm_name}: {e}")
-            raise
+        logger.debug("🎯 Current VM context set to: %s", vm_name)
     
     @track_vmware_operation("Get ISO Status")
     def get_iso_status(self, vm_name):
         """Get ISO mount status with enhanced logging"""
         self.set_current_vm(vm_name)
-        logger.debug(f"🔍 Checking ISO status for VM: {vm_name}")
+        logger.debug("🔍 Checking ISO status for VM: %s", vm_name)
         
         try:
             status = self.media_ops.get_iso_status(vm_name)
-            logger.debug(f"📋 ISO status for VM {vm_name}: {status}")
+            logger.debug("📋 ISO status for VM %s: %s", vm_name, status)
             return status
         except Exception as e:
-            logger.error(f"❌ Failed to get ISO status for VM {vm_name}: {e}")
+            logger.error("❌ Failed to get ISO status for VM %s: %s", vm_name, e)
             raise
     
     def get_connection_stats(self):
@@ -277,11 +138,11 @@ class VMwareClient:
                 'current_vm_context': self._current_vm_name
             }
             
-            logger.debug(f"📊 Connection stats: {stats}")
+            logger.debug("📊 Connection stats: %s", stats)
             return stats
             
         except Exception as e:
-            logger.error(f"❌ Failed to get connection stats: {e}")
+            logger.error("❌ Failed to get connection stats: %s", e)
             return {'error': str(e)}
     
     # Connection methods
@@ -310,6 +171,10 @@ class VMwareClient:
         """Get VM power state"""
         return self.vm_ops.get_vm_power_state(vm_name)
     
+    def get_vm_power_states(self, vm_names):
+        """Get the power state of several VMs in one vCenter query"""
+        return self.vm_ops.get_vm_power_states(vm_names)
+    
     # Power management methods
     def power_on_vm(self, vm_name):
         """Power on a virtual machine"""